@@ -5,15 +5,118 @@ Demonstrates the advanced AI browser agent capabilities in real-time.
 """
 
 import asyncio
-import json
 import time
-import requests
+import aiohttp
+import orjson
 from datetime import datetime
-import sys
 import os
+import sys
+
+try:
+    import ijson
+except ImportError:  # Optional: without it the workflow list is parsed in one go
+    ijson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: falls back to the default asyncio loop
+    uvloop = None
+
+API_BASE_URL = "http://localhost:5001"
+
+# Backoff schedule for absorbing a cold-starting API without stalling the demo
+RETRY_DELAYS = (0.2, 0.4, 0.8)
+RETRY_ATTEMPT_TIMEOUT = 1.0
+RETRY_BUDGET = 3.0
+
+# Successful /api/demo and workflow payloads are reused across demo runs for this
+# many seconds; /health is always fetched live
+CACHE_TTL = 60
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "orbit-demo.json")
+
+# Static demo content
+_COMPONENTS = (
+    ("🎯 Planner Agent", "AutoGen + LangGraph orchestration for intelligent task decomposition"),
+    ("👁️  Vision Agent", "Computer vision + OCR for UI element detection and visual understanding"),
+    ("🧠 Memory Manager", "ChromaDB vector storage for long-term learning and context retention"),
+    ("🛡️  Policy Agent", "Security guardrails and compliance checks for safe automation"),
+    ("🌐 Browser Agent", "Playwright-powered web automation with self-healing capabilities"),
+    ("☁️  Cloudflare Edge", "Workers AI, Durable Objects, and AI Gateway for global scale"),
+)
+
+_TASKS = (
+    "🔍 Intelligent element detection using computer vision",
+    "📝 Smart form filling with context awareness",
+    "📊 Data extraction with AI-powered parsing",
+    "🔗 Multi-page navigation with planning",
+    "🛡️  Security-aware interaction with policy checks",
+    "💾 Memory-enhanced workflow execution",
+)
+
+_ADVANTAGES = (
+    "Self-healing selectors that adapt to UI changes",
+    "Vision-based element detection when CSS selectors fail",
+    "Intelligent retry logic with exponential backoff",
+    "Memory of successful interaction patterns",
+    "Policy-guided decision making for safety",
+)
+
+_MONITORING_FEATURES = (
+    ("📊 OpenTelemetry Tracing", "Distributed tracing across all agent components"),
+    ("📈 Prometheus Metrics", "Real-time performance and usage metrics"),
+    ("🏥 Health Monitoring", "Continuous system health checks"),
+    ("⚡ Performance Tracking", "Response times and resource utilization"),
+    ("🔍 Error Analytics", "Intelligent error detection and analysis"),
+    ("📱 Real-time Dashboard", "Beautiful monitoring dashboard at localhost:8080"),
+)
+
+_EDGE_FEATURES = (
+    "🚀 Cloudflare Workers AI for remote GPU inference",
+    "💾 Durable Objects for zero-latency state management",
+    "🔄 AI Gateway for intelligent caching and analytics",
+    "🌐 Global edge deployment across 200+ cities",
+    "⚡ Sub-100ms response times worldwide",
+    "🔒 Enterprise-grade security and compliance",
+)
+
+_SCALE_POTENTIAL = (
+    "Ready to handle 1M+ concurrent users",
+    "Auto-scaling from 0 to infinity",
+    "Pay-as-you-scale pricing model",
+    "99.99% uptime SLA ready",
+)
+
+_COMPETITIVE_ADVANTAGES = (
+    ("🧠 True AI Intelligence", "Not just scripted automation - real AI reasoning and adaptation"),
+    ("👁️  Computer Vision", "Can interact with any UI, even without selectors"),
+    ("🎯 Self-Healing", "Automatically adapts to website changes"),
+    ("💾 Learning Memory", "Gets better with every interaction"),
+    ("⚡ Lightning Fast", "Local + edge hybrid for optimal performance"),
+    ("🛡️  Enterprise Ready", "Built-in security, compliance, and monitoring"),
+    ("🌍 Global Scale", "Edge-first architecture for worldwide deployment"),
+    ("💰 Cost Optimized", "Near-zero cost for development, pay-as-you-scale"),
+)
+
+_USE_CASES = (
+    ("🏠 Real Estate", "Automated property search, lead generation, market analysis"),
+    ("🛒 E-commerce", "Price monitoring, inventory tracking, competitor analysis"),
+    ("📊 Data Analytics", "Web scraping, report generation, data validation"),
+    ("🧪 Testing & QA", "Automated testing, regression testing, performance monitoring"),
+    ("📈 Lead Generation", "Prospect research, contact discovery, CRM integration"),
+    ("📱 Social Media", "Content monitoring, engagement tracking, sentiment analysis"),
+    ("💼 Business Process", "Form filling, document processing, workflow automation"),
+    ("🔬 Research", "Academic research, market research, competitive intelligence"),
+)
 
-# Add parent directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+_NEXT_STEPS = (
+    ("1. 🛠️  Start Development", "npm run start"),
+    ("2. 🧪 Run Tests", "npm run test:all"),
+    ("3. 📊 Monitor Performance", "npm run monitor"),
+    ("4. ☁️  Deploy to Edge", "npm run setup:cloudflare && npm run deploy:workers"),
+    ("5. 🌍 Scale Globally", "Configure production environment and go live!"),
+)
+
+SPINNER_CHARS = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
 
 # Color codes for beautiful output
 class Colors:
@@ -43,13 +146,30 @@ def print_banner():
 {Colors.CYAN}🌟 Welcome to the future of AI-powered browser automation!{Colors.END}
 {Colors.YELLOW}✨ Prepare to witness mind-blowing capabilities that will revolutionize web interaction{Colors.END}
 """
-    print(banner)
+    write_block([banner])
+
+def write_block(lines):
+    """Write a block of lines to stdout with a single os.write call"""
+    buf = ("\n".join(lines) + "\n").encode()
+    # Anything already queued through print() must land first
+    sys.stdout.flush()
+    fd = sys.stdout.fileno()
+    while buf:
+        buf = buf[os.write(fd, buf):]
+
+def section_lines(title, icon="🔥"):
+    """Build the lines of a beautiful section header"""
+    return [
+        "",
+        f"{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.END}",
+        f"{Colors.BOLD}{Colors.CYAN}{icon} {title.upper()}{Colors.END}",
+        f"{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.END}",
+        "",
+    ]
 
 def print_section(title, icon="🔥"):
     """Print a beautiful section header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{icon} {title.upper()}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.END}\n")
+    write_block(section_lines(title, icon))
 
 def print_success(message):
     """Print success message"""
@@ -67,42 +187,140 @@ def print_error(message):
     """Print error message"""
     print(f"{Colors.RED}❌ {message}{Colors.END}")
 
-def animate_loading(message, duration=2):
+async def animate_loading(message, duration=2):
     """Animated loading effect"""
-    chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-    end_time = time.time() + duration
+    chars = SPINNER_CHARS
+    stop = asyncio.Event()
+    asyncio.get_running_loop().call_later(duration, stop.set)
     i = 0
-    while time.time() < end_time:
+    while not stop.is_set():
         print(f"\r{Colors.YELLOW}{chars[i % len(chars)]} {message}...{Colors.END}", end="", flush=True)
-        time.sleep(0.1)
+        try:
+            # Yield to other tasks between frames; wakes early once the stop fires
+            await asyncio.wait_for(stop.wait(), timeout=0.1)
+        except asyncio.TimeoutError:
+            pass
         i += 1
     print(f"\r{Colors.GREEN}✅ {message} complete!{Colors.END}")
 
-def test_api_connectivity():
+async def animate_batch(message, items, duration=1.5):
+    """Run one loading step per item concurrently behind a shared progress line"""
+    total = len(items)
+    completed = 0
+    
+    async def run_step(item):
+        nonlocal completed
+        await asyncio.sleep(duration)
+        completed += 1
+    
+    steps = asyncio.gather(*(run_step(item) for item in items))
+    i = 0
+    while not steps.done():
+        print(f"\r{Colors.YELLOW}{SPINNER_CHARS[i % len(SPINNER_CHARS)]} [{completed}/{total}] {message}...{Colors.END}", end="", flush=True)
+        await asyncio.wait({steps}, timeout=0.1)
+        i += 1
+    await steps
+    print(f"\r{Colors.GREEN}✅ [{total}/{total}] {message} complete!{Colors.END}")
+
+async def open_with_retry(session, method, url, **kwargs):
+    """Open a response with bounded exponential backoff; the caller releases it"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + RETRY_BUDGET
+    for attempt, delay in enumerate(RETRY_DELAYS):
+        remaining = deadline - loop.time()
+        timeout = aiohttp.ClientTimeout(total=min(RETRY_ATTEMPT_TIMEOUT, remaining))
+        try:
+            return await session.request(method, url, timeout=timeout, **kwargs)
+        except (asyncio.TimeoutError, aiohttp.ClientConnectorError):
+            # Give up once the schedule or the overall budget is exhausted
+            if attempt == len(RETRY_DELAYS) - 1 or deadline - loop.time() <= delay:
+                raise
+            await asyncio.sleep(delay)
+
+async def request_json(session, method, url, **kwargs):
+    """Send a request with bounded exponential backoff, returning (status, json)"""
+    async with await open_with_retry(session, method, url, **kwargs) as response:
+        data = orjson.loads(await response.read()) if response.status == 200 else None
+        return response.status, data
+
+def _load_response_cache():
+    """Load cached GET payloads left behind by a previous demo run"""
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def _save_response_cache(cache):
+    """Persist cached GET payloads for the next demo run"""
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, "wb") as f:
+            f.write(orjson.dumps(cache))
+    except OSError:
+        pass
+
+_response_cache = _load_response_cache()
+
+async def cached_get_json(session, url, ttl=CACHE_TTL):
+    """GET a JSON payload, serving it from the TTL cache when still fresh"""
+    now = time.time()
+    hit = _response_cache.get(url)
+    if hit and now - hit[0] < ttl:
+        return 200, hit[1]
+    
+    status, data = await request_json(session, "GET", url)
+    if status == 200:
+        _response_cache[url] = (now, data)
+        _save_response_cache(_response_cache)
+    return status, data
+
+async def stream_workflows(session, url, ttl=CACHE_TTL):
+    """Yield workflows as they are parsed off the wire, reusing the TTL cache"""
+    now = time.time()
+    hit = _response_cache.get(url)
+    if ijson is None or (hit and now - hit[0] < ttl):
+        status, data = await cached_get_json(session, url, ttl)
+        if status == 200:
+            for workflow in data['workflows']:
+                yield workflow
+        return
+    
+    workflows = []
+    async with await open_with_retry(session, "GET", url) as response:
+        if response.status != 200:
+            return
+        async for workflow in ijson.items_async(response.content, "workflows.item", use_float=True):
+            workflows.append(workflow)
+            yield workflow
+    
+    _response_cache[url] = (now, {"workflows": workflows, "total": len(workflows)})
+    _save_response_cache(_response_cache)
+
+async def test_api_connectivity(session):
     """Test API connectivity and basic functionality"""
     print_section("API Connectivity & Health Check", "🏥")
     
     try:
-        animate_loading("Checking API health", 2)
-        response = requests.get("http://localhost:5001/health", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
+        await animate_loading("Checking API health", 2)
+        # Liveness is never cached: a stale entry would report a down API as healthy
+        status, data = await request_json(session, "GET", f"{API_BASE_URL}/health")
+        if status == 200:
             print_success(f"API is healthy! Service: {data['service']}")
             print_info(f"Timestamp: {data['timestamp']}")
         else:
-            print_error(f"API health check failed: {response.status_code}")
+            print_error(f"API health check failed: {status}")
             return False
             
-        animate_loading("Testing demo endpoint", 2)
-        response = requests.get("http://localhost:5001/api/demo", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
+        await animate_loading("Testing demo endpoint", 2)
+        status, data = await cached_get_json(session, f"{API_BASE_URL}/api/demo")
+        if status == 200:
             print_success("Demo endpoint working!")
             print(f"{Colors.BOLD}🎯 Core Features Available:{Colors.END}")
             for feature in data['features']:
                 print(f"  {Colors.GREEN}•{Colors.END} {feature}")
         else:
-            print_error(f"Demo endpoint failed: {response.status_code}")
+            print_error(f"Demo endpoint failed: {status}")
             return False
             
         return True
@@ -111,60 +329,34 @@ def test_api_connectivity():
         print_error(f"API connectivity test failed: {e}")
         return False
 
-def demonstrate_agent_architecture():
+async def demonstrate_agent_architecture():
     """Demonstrate the advanced agent architecture"""
     print_section("Advanced AI Agent Architecture", "🧠")
     
     print(f"{Colors.BOLD}🏗️  OrbitAgents Architecture Components:{Colors.END}")
     
-    components = [
-        ("🎯 Planner Agent", "AutoGen + LangGraph orchestration for intelligent task decomposition"),
-        ("👁️  Vision Agent", "Computer vision + OCR for UI element detection and visual understanding"),
-        ("🧠 Memory Manager", "ChromaDB vector storage for long-term learning and context retention"),
-        ("🛡️  Policy Agent", "Security guardrails and compliance checks for safe automation"),
-        ("🌐 Browser Agent", "Playwright-powered web automation with self-healing capabilities"),
-        ("☁️  Cloudflare Edge", "Workers AI, Durable Objects, and AI Gateway for global scale")
-    ]
-    
-    for component, description in components:
-        animate_loading(f"Initializing {component}", 1.5)
+    await animate_batch("Initializing components", _COMPONENTS, 1.5)
+    for component, description in _COMPONENTS:
         print(f"  {Colors.CYAN}{component}{Colors.END}: {description}")
     
     print(f"\n{Colors.BOLD}{Colors.GREEN}🎉 All agent components initialized and ready!{Colors.END}")
 
-def demonstrate_browser_automation():
+async def demonstrate_browser_automation():
     """Demonstrate browser automation capabilities"""
     print_section("Browser Automation Powers", "🌐")
     
     print(f"{Colors.BOLD}🚀 Demonstrating Advanced Browser Automation:{Colors.END}\n")
     
-    # Simulate browser automation tasks
-    tasks = [
-        "🔍 Intelligent element detection using computer vision",
-        "📝 Smart form filling with context awareness", 
-        "📊 Data extraction with AI-powered parsing",
-        "🔗 Multi-page navigation with planning",
-        "🛡️  Security-aware interaction with policy checks",
-        "💾 Memory-enhanced workflow execution"
-    ]
-    
-    for task in tasks:
-        animate_loading(task, 2)
+    for task in _TASKS:
+        await animate_loading(task, 2)
         print_success(f"Completed: {task}")
     
     print(f"\n{Colors.BOLD}{Colors.CYAN}💡 Key Advantages:{Colors.END}")
-    advantages = [
-        "Self-healing selectors that adapt to UI changes",
-        "Vision-based element detection when CSS selectors fail",
-        "Intelligent retry logic with exponential backoff",
-        "Memory of successful interaction patterns",
-        "Policy-guided decision making for safety"
-    ]
     
-    for advantage in advantages:
+    for advantage in _ADVANTAGES:
         print(f"  {Colors.GREEN}•{Colors.END} {advantage}")
 
-def demonstrate_ai_capabilities():
+async def demonstrate_ai_capabilities(session):
     """Demonstrate AI and ML capabilities"""
     print_section("AI & Machine Learning Powers", "🤖")
     
@@ -172,19 +364,18 @@ def demonstrate_ai_capabilities():
     
     # Test AI workflow endpoint
     try:
-        animate_loading("Fetching available AI workflows", 2)
-        response = requests.get("http://localhost:5001/api/browser-agent/workflows", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            print_success(f"Found {data['total']} AI-powered workflows!")
-            
-            for workflow in data['workflows']:
-                print(f"\n{Colors.CYAN}📋 {workflow['name']}{Colors.END}")
-                print(f"   {workflow['description']}")
-                print(f"   {Colors.YELLOW}Steps: {workflow['steps']} | Status: {workflow['status']}{Colors.END}")
+        await animate_loading("Fetching available AI workflows", 2)
+        total = 0
+        async for workflow in stream_workflows(session, f"{API_BASE_URL}/api/browser-agent/workflows"):
+            print(f"\n{Colors.CYAN}📋 {workflow['name']}{Colors.END}")
+            print(f"   {workflow['description']}")
+            print(f"   {Colors.YELLOW}Steps: {workflow['steps']} | Status: {workflow['status']}{Colors.END}")
+            total += 1
+        if total:
+            print_success(f"Found {total} AI-powered workflows!")
                 
         # Demonstrate workflow execution
-        animate_loading("Executing sample AI workflow", 3)
+        await animate_loading("Executing sample AI workflow", 3)
         execution_data = {
             "workflow_id": 1,
             "parameters": {
@@ -193,14 +384,15 @@ def demonstrate_ai_capabilities():
             }
         }
         
-        response = requests.post(
-            "http://localhost:5001/api/browser-agent/execute", 
-            json=execution_data,
-            timeout=5
+        status, result = await request_json(
+            session,
+            "POST",
+            f"{API_BASE_URL}/api/browser-agent/execute",
+            data=orjson.dumps(execution_data),
+            headers={"Content-Type": "application/json"}
         )
         
-        if response.status_code == 200:
-            result = response.json()
+        if status == 200:
             print_success("Workflow execution started!")
             print_info(f"Execution ID: {result['execution_id']}")
             print_info(f"Status: {result['status']}")
@@ -210,149 +402,104 @@ def demonstrate_ai_capabilities():
         print_warning(f"AI demonstration encountered: {e}")
         print_info("This is normal in demo mode - full AI requires additional setup")
 
-def demonstrate_monitoring():
+async def demonstrate_monitoring():
     """Demonstrate monitoring and observability"""
     print_section("Monitoring & Observability", "📊")
     
     print(f"{Colors.BOLD}📈 Real-time Monitoring Capabilities:{Colors.END}\n")
     
-    monitoring_features = [
-        ("📊 OpenTelemetry Tracing", "Distributed tracing across all agent components"),
-        ("📈 Prometheus Metrics", "Real-time performance and usage metrics"),
-        ("🏥 Health Monitoring", "Continuous system health checks"),
-        ("⚡ Performance Tracking", "Response times and resource utilization"),
-        ("🔍 Error Analytics", "Intelligent error detection and analysis"),
-        ("📱 Real-time Dashboard", "Beautiful monitoring dashboard at localhost:8080")
-    ]
-    
-    for feature, description in monitoring_features:
-        animate_loading(f"Activating {feature}", 1.5)
+    await animate_batch("Activating monitoring features", _MONITORING_FEATURES, 1.5)
+    for feature, description in _MONITORING_FEATURES:
         print(f"  {Colors.CYAN}{feature}{Colors.END}: {description}")
     
     print(f"\n{Colors.GREEN}✅ All monitoring systems operational!{Colors.END}")
     print_info("Access monitoring dashboard at http://localhost:8080 (when monitoring is running)")
 
-def demonstrate_edge_computing():
+async def demonstrate_edge_computing():
     """Demonstrate edge computing capabilities"""
     print_section("Edge Computing & Scalability", "☁️")
     
     print(f"{Colors.BOLD}🌍 Global Edge Computing Powers:{Colors.END}\n")
     
-    edge_features = [
-        "🚀 Cloudflare Workers AI for remote GPU inference",
-        "💾 Durable Objects for zero-latency state management", 
-        "🔄 AI Gateway for intelligent caching and analytics",
-        "🌐 Global edge deployment across 200+ cities",
-        "⚡ Sub-100ms response times worldwide",
-        "🔒 Enterprise-grade security and compliance"
-    ]
-    
-    for feature in edge_features:
-        animate_loading(feature, 1.5)
+    await animate_batch("Preparing edge features", _EDGE_FEATURES, 1.5)
+    for feature in _EDGE_FEATURES:
         print_success(f"Ready: {feature}")
     
     print(f"\n{Colors.BOLD}{Colors.CYAN}💡 Scale Potential:{Colors.END}")
-    print(f"  {Colors.GREEN}•{Colors.END} Ready to handle 1M+ concurrent users")
-    print(f"  {Colors.GREEN}•{Colors.END} Auto-scaling from 0 to infinity")
-    print(f"  {Colors.GREEN}•{Colors.END} Pay-as-you-scale pricing model")
-    print(f"  {Colors.GREEN}•{Colors.END} 99.99% uptime SLA ready")
+    for point in _SCALE_POTENTIAL:
+        print(f"  {Colors.GREEN}•{Colors.END} {point}")
 
 def show_competitive_advantages():
     """Show competitive advantages"""
-    print_section("Competitive Advantages", "🏆")
+    lines = section_lines("Competitive Advantages", "🏆")
+    lines += [f"{Colors.BOLD}🥇 Why OrbitAgents Dominates the Market:{Colors.END}", ""]
     
-    print(f"{Colors.BOLD}🥇 Why OrbitAgents Dominates the Market:{Colors.END}\n")
+    for title, description in _COMPETITIVE_ADVANTAGES:
+        lines += [f"{Colors.BOLD}{Colors.CYAN}{title}{Colors.END}", f"  {description}", ""]
     
-    advantages = [
-        ("🧠 True AI Intelligence", "Not just scripted automation - real AI reasoning and adaptation"),
-        ("👁️  Computer Vision", "Can interact with any UI, even without selectors"),
-        ("🎯 Self-Healing", "Automatically adapts to website changes"),
-        ("💾 Learning Memory", "Gets better with every interaction"),
-        ("⚡ Lightning Fast", "Local + edge hybrid for optimal performance"),
-        ("🛡️  Enterprise Ready", "Built-in security, compliance, and monitoring"),
-        ("🌍 Global Scale", "Edge-first architecture for worldwide deployment"),
-        ("💰 Cost Optimized", "Near-zero cost for development, pay-as-you-scale")
-    ]
-    
-    for title, description in advantages:
-        print(f"{Colors.BOLD}{Colors.CYAN}{title}{Colors.END}")
-        print(f"  {description}")
-        print()
+    write_block(lines)
 
 def show_use_cases():
     """Show real-world use cases"""
-    print_section("Real-World Use Cases", "🎯")
-    
-    print(f"{Colors.BOLD}🌟 Transform These Industries:{Colors.END}\n")
+    lines = section_lines("Real-World Use Cases", "🎯")
+    lines += [f"{Colors.BOLD}🌟 Transform These Industries:{Colors.END}", ""]
     
-    use_cases = [
-        ("🏠 Real Estate", "Automated property search, lead generation, market analysis"),
-        ("🛒 E-commerce", "Price monitoring, inventory tracking, competitor analysis"),
-        ("📊 Data Analytics", "Web scraping, report generation, data validation"),
-        ("🧪 Testing & QA", "Automated testing, regression testing, performance monitoring"),
-        ("📈 Lead Generation", "Prospect research, contact discovery, CRM integration"),
-        ("📱 Social Media", "Content monitoring, engagement tracking, sentiment analysis"),
-        ("💼 Business Process", "Form filling, document processing, workflow automation"),
-        ("🔬 Research", "Academic research, market research, competitive intelligence")
-    ]
+    for industry, applications in _USE_CASES:
+        lines += [f"{Colors.BOLD}{Colors.BLUE}{industry}{Colors.END}", f"  {applications}", ""]
     
-    for industry, applications in use_cases:
-        print(f"{Colors.BOLD}{Colors.BLUE}{industry}{Colors.END}")
-        print(f"  {applications}")
-        print()
+    write_block(lines)
 
 def show_next_steps():
     """Show next steps for users"""
-    print_section("Ready to Get Started?", "🚀")
-    
-    print(f"{Colors.BOLD}🎯 Next Steps to Harness the Power:{Colors.END}\n")
-    
-    steps = [
-        ("1. 🛠️  Start Development", "npm run start"),
-        ("2. 🧪 Run Tests", "npm run test:all"),
-        ("3. 📊 Monitor Performance", "npm run monitor"),
-        ("4. ☁️  Deploy to Edge", "npm run setup:cloudflare && npm run deploy:workers"),
-        ("5. 🌍 Scale Globally", "Configure production environment and go live!")
-    ]
+    lines = section_lines("Ready to Get Started?", "🚀")
+    lines += [f"{Colors.BOLD}🎯 Next Steps to Harness the Power:{Colors.END}", ""]
     
-    for step, command in steps:
-        print(f"{Colors.CYAN}{step}{Colors.END}")
-        print(f"  {Colors.YELLOW}Command: {command}{Colors.END}")
-        print()
+    for step, command in _NEXT_STEPS:
+        lines += [f"{Colors.CYAN}{step}{Colors.END}", f"  {Colors.YELLOW}Command: {command}{Colors.END}", ""]
     
-    print(f"{Colors.BOLD}{Colors.GREEN}🎉 You're now ready to revolutionize browser automation with AI!{Colors.END}")
+    lines.append(f"{Colors.BOLD}{Colors.GREEN}🎉 You're now ready to revolutionize browser automation with AI!{Colors.END}")
+    write_block(lines)
 
 async def main():
     """Main demo execution"""
     print_banner()
     
-    # Check if API is running
-    if not test_api_connectivity():
-        print_error("API is not running. Please start it with: PORT=5001 python3 api/index.py")
-        return
+    async with aiohttp.ClientSession() as session:
+        # Check if API is running
+        if not await test_api_connectivity(session):
+            print_error("API is not running. Please start it with: PORT=5001 python3 api/index.py")
+            return
+        
+        # Run all demonstrations
+        await demonstrate_agent_architecture()
+        await demonstrate_browser_automation()
+        await demonstrate_ai_capabilities(session)
     
-    # Run all demonstrations
-    demonstrate_agent_architecture()
-    demonstrate_browser_automation()
-    demonstrate_ai_capabilities()
-    demonstrate_monitoring()
-    demonstrate_edge_computing()
+    await demonstrate_monitoring()
+    await demonstrate_edge_computing()
     show_competitive_advantages()
     show_use_cases()
     show_next_steps()
     
     # Final banner
-    print(f"\n{Colors.PURPLE}{Colors.BOLD}")
-    print("╔══════════════════════════════════════════════════════════════════╗")
-    print("║                   🎉 DEMO COMPLETE! 🎉                           ║")
-    print("║                                                                  ║")
-    print("║      OrbitAgents is ready to revolutionize browser automation!  ║")
-    print("║                                                                  ║")
-    print("╚══════════════════════════════════════════════════════════════════╝")
-    print(f"{Colors.END}")
-    
-    print(f"\n{Colors.CYAN}🌟 Thank you for witnessing the future of AI-powered web automation!{Colors.END}")
-    print(f"{Colors.YELLOW}💡 Ready to build something amazing? Start with: npm run start{Colors.END}")
+    write_block([
+        "",
+        f"{Colors.PURPLE}{Colors.BOLD}",
+        "╔══════════════════════════════════════════════════════════════════╗",
+        "║                   🎉 DEMO COMPLETE! 🎉                           ║",
+        "║                                                                  ║",
+        "║      OrbitAgents is ready to revolutionize browser automation!  ║",
+        "║                                                                  ║",
+        "╚══════════════════════════════════════════════════════════════════╝",
+        f"{Colors.END}",
+        "",
+        f"{Colors.CYAN}🌟 Thank you for witnessing the future of AI-powered web automation!{Colors.END}",
+        f"{Colors.YELLOW}💡 Ready to build something amazing? Start with: npm run start{Colors.END}",
+    ])
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        asyncio.run(main())
@@ -5,9 +5,46 @@ Showcases the beautiful new OrbitAgents space UI
 """
 
 import asyncio
+import signal
+import sys
 import time
 from playwright.async_api import async_playwright
 
+try:
+    import uvloop
+except ImportError:  # Optional: falls back to the default asyncio loop
+    uvloop = None
+
+# How often the idle page is touched while the browser is left open
+KEEPALIVE_INTERVAL = 60
+
+async def keep_page_alive(page, interval=KEEPALIVE_INTERVAL):
+    """Periodically evaluate a no-op so the idle tab stays warm"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await page.evaluate("1")
+        except Exception:
+            return
+
+async def wait_for_close(prompt):
+    """Wait for Enter or Ctrl-C without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    shutdown = asyncio.Event()
+    
+    def on_stdin():
+        sys.stdin.readline()
+        shutdown.set()
+    
+    print(prompt, end="", flush=True)
+    loop.add_reader(sys.stdin.fileno(), on_stdin)
+    loop.add_signal_handler(signal.SIGINT, shutdown.set)
+    try:
+        await shutdown.wait()
+    finally:
+        loop.remove_reader(sys.stdin.fileno())
+        loop.remove_signal_handler(signal.SIGINT)
+
 async def demo_space_frontend():
     print("🌌 OrbitAgents Space UI Demo")
     print("=" * 40)
@@ -67,8 +104,14 @@ async def demo_space_frontend():
         finally:
             print("🌌 Keeping browser open for exploration...")
             # Don't close browser so user can explore
-            input("Press Enter to close browser and end demo...")
+            keepalive = asyncio.create_task(keep_page_alive(page))
+            await wait_for_close("Press Enter to close browser and end demo...")
+            keepalive.cancel()
             await browser.close()
 
 if __name__ == "__main__":
-    asyncio.run(demo_space_frontend())
+    if uvloop is not None:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(demo_space_frontend())
+    else:
+        asyncio.run(demo_space_frontend())
@@ -4,16 +4,33 @@ Implements OpenTelemetry tracing, metrics, and comprehensive logging
 """
 
 import os
+import re
+import sys
 import time
+import io
+import gzip
 import json
+import queue
+import atexit
 import asyncio
+import logging
+import logging.handlers
+import itertools
+import threading
+import collections
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import structlog
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib JSON encoder
+    orjson = None
+
 # OpenTelemetry imports
 from opentelemetry import trace, metrics
+from opentelemetry.metrics import CallbackOptions, Observation
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
 from opentelemetry.sdk.metrics import MeterProvider
@@ -22,20 +39,114 @@ from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExport
 from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
 from opentelemetry.instrumentation.flask import FlaskInstrumentor
 from opentelemetry.instrumentation.requests import RequestsInstrumentor
+from grpc import Compression
 
 # Prometheus metrics
 from prometheus_client import Counter, Histogram, Gauge, Summary, CollectorRegistry, push_to_gateway, start_http_server
+from prometheus_client import make_wsgi_app, multiprocess
+
+# Log records are handed off to a queue and written by a listener thread,
+# so logging from the task hot paths never blocks on terminal/file I/O
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_stdlib_logger = logging.getLogger(__name__)
+_stdlib_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_stdlib_logger.setLevel(logging.INFO)
+_stdlib_logger.propagate = False
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """orjson-backed serializer for structlog's JSONRenderer"""
+    return orjson.dumps(obj, **kwargs).decode()
 
 # Configure structured logging
-logger = structlog.get_logger()
+logger = structlog.wrap_logger(
+    _stdlib_logger,
+    processors=[
+        structlog.stdlib.filter_by_level,
+        structlog.stdlib.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps) if orjson
+        else structlog.processors.JSONRenderer()
+    ],
+    wrapper_class=structlog.stdlib.BoundLogger
+)
+
+# Bounded label values; anything else is coerced so Prometheus series stay finite
+_ALLOWED_TASK_TYPES = frozenset({
+    "authentication", "form_interaction", "data_extraction",
+    "navigation", "element_interaction", "general"
+})
+_ALLOWED_ACTION_TYPES = frozenset({
+    "click", "type", "navigate", "extract", "wait", "scroll", "screenshot"
+})
+_ALLOWED_ERROR_TYPES = frozenset({
+    "Error", "TimeoutError", "ConnectionError", "ValueError", "KeyError",
+    "TypeError", "AttributeError", "RuntimeError", "PermissionError", "JSONDecodeError"
+})
+_ALLOWED_MEMORY_OPERATIONS = frozenset({"store", "retrieve", "search", "update", "delete"})
+_ALLOWED_VISION_OPERATIONS = frozenset({"analyze", "detect_elements", "ocr", "screenshot"})
+_TASK_STATUSES = ("success", "failure", "error")
+
+# Task-type keywords compiled into one pattern; the lookahead lets matches
+# overlap so every keyword is seen in a single scan of the description
+_TASK_TYPE_RE = re.compile(
+    r"(?=(?P<auth>login|authenticate|sign in)"
+    r"|(?P<form>form|fill|submit|input)"
+    r"|(?P<extract>extract|scrape|data|content)"
+    r"|(?P<nav>navigate|go to|visit|open)"
+    r"|(?P<click>click|button|link))",
+    re.IGNORECASE
+)
+# Checked in order, so the first category present wins as before
+_TASK_TYPE_PRIORITY = (
+    ("auth", "authentication"),
+    ("form", "form_interaction"),
+    ("extract", "data_extraction"),
+    ("nav", "navigation"),
+    ("click", "element_interaction"),
+)
+
+
+def _bounded_label(value: str, allowed: frozenset, label: str, fallback: str = "other") -> str:
+    """Return value if it is an allowed label value, otherwise the fallback"""
+    if value in allowed:
+        return value
+    logger.debug("Coerced metric label", label=label, value=value, coerced_to=fallback)
+    return fallback
 
-@dataclass
+
+class _LabelChildren(dict):
+    """Labelled children of one metric keyed by label values, bound on first use
+    
+    Keys are label values in labelnames order; ``known`` keys are bound up front.
+    """
+    
+    def __init__(self, metric, known=()):
+        super().__init__()
+        self.metric = metric
+        for key in known:
+            self[key]
+    
+    def __missing__(self, key):
+        values = key if isinstance(key, tuple) else (key,)
+        child = self[key] = self.metric.labels(*values)
+        return child
+
+
+@dataclass(slots=True)
 class AgentMetrics:
     """Metrics data structure for browser agent performance"""
     task_id: str
     task_description: str
-    start_time: float
+    start_time: float  # Wall-clock epoch seconds, for export
     end_time: Optional[float] = None
+    start_ns: int = field(default_factory=time.monotonic_ns, repr=False)  # Durations only
+    end_ns: Optional[int] = field(default=None, repr=False)
     success: bool = False
     steps_completed: int = 0
     total_steps: int = 0
@@ -47,13 +158,19 @@ class AgentMetrics:
     policy_checks: int = 0
     browser_actions: int = 0
     final_url: str = ""
+    otel_span: Optional[Any] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def duration_ns(self) -> int:
+        """Calculate task duration in nanoseconds"""
+        if self.end_ns is not None:
+            return self.end_ns - self.start_ns
+        return time.monotonic_ns() - self.start_ns
     
     @property
     def duration(self) -> float:
-        """Calculate task duration"""
-        if self.end_time:
-            return self.end_time - self.start_time
-        return time.time() - self.start_time
+        """Calculate task duration in seconds"""
+        return self.duration_ns * 1e-9
     
     @property
     def success_rate(self) -> float:
@@ -64,17 +181,81 @@ class AgentMetrics:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging/export"""
-        return asdict(self)
+        # All fields are primitives, so skip asdict()'s recursive deepcopy.
+        # The monotonic clock readings stay internal; duration covers them.
+        return {
+            "task_id": self.task_id,
+            "task_description": self.task_description,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "success": self.success,
+            "steps_completed": self.steps_completed,
+            "total_steps": self.total_steps,
+            "errors_count": self.errors_count,
+            "screenshots_taken": self.screenshots_taken,
+            "data_extracted_count": self.data_extracted_count,
+            "memory_operations": self.memory_operations,
+            "vision_operations": self.vision_operations,
+            "policy_checks": self.policy_checks,
+            "browser_actions": self.browser_actions,
+            "final_url": self.final_url,
+            "duration": self.duration,
+            "success_rate": self.success_rate
+        }
+
+
+def _multiprocess_enabled(requested: Optional[bool]) -> bool:
+    """Resolve a multiprocess flag; defaults to on whenever PROMETHEUS_MULTIPROC_DIR is set"""
+    configured = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+    if requested is None:
+        return configured
+    if requested and not configured:
+        # prometheus_client picks its value storage at import time
+        logger.warning("PROMETHEUS_MULTIPROC_DIR must be set before startup, "
+                       "falling back to per-process metrics")
+        return False
+    return requested
+
+
+def _prometheus_registries(enable_multiprocess: bool):
+    """Return the registry to expose and the registry to create metrics in"""
+    registry = CollectorRegistry()
+    if not enable_multiprocess:
+        return registry, registry
+    
+    # Values live in shared mmap files; the exposed registry only reads them
+    # back aggregated across processes, so the metrics stay unregistered
+    multiprocess.MultiProcessCollector(registry)
+    atexit.register(multiprocess.mark_process_dead, os.getpid())
+    return registry, None
+
+
+# Metrics archives written by MetricsCollector.export_metrics_to_file
+EXPORT_BUFFER_SIZE = 64 * 1024
+EXPORT_FLUSH_SNAPSHOTS = 100
 
 
 class MetricsCollector:
     """Centralized metrics collection for the browser agent"""
     
-    def __init__(self, enable_prometheus: bool = True, enable_otel: bool = True):
+    def __init__(self, enable_prometheus: bool = True, enable_otel: bool = True,
+                 export_interval_ms: int = 60000, enable_multiprocess: Optional[bool] = None):
         self.enable_prometheus = enable_prometheus
         self.enable_otel = enable_otel
+        self.enable_multiprocess = _multiprocess_enabled(enable_multiprocess)
+        self.export_interval_ms = export_interval_ms
         self.active_tasks: Dict[str, AgentMetrics] = {}
         
+        # OTel counter totals, accumulated locally and reported once per export
+        self._otel_counts_lock = threading.Lock()
+        self._otel_task_counts: collections.Counter = collections.Counter()
+        self._otel_error_counts: collections.Counter = collections.Counter()
+        
+        # Open NDJSON.gz archives keyed by path: [GzipFile, raw writer, unflushed snapshots]
+        self._export_lock = threading.Lock()
+        self._export_files: Dict[str, list] = {}
+        atexit.register(self.close_exports)
+        
         # Initialize OpenTelemetry
         if enable_otel:
             self._setup_opentelemetry()
@@ -85,7 +266,8 @@ class MetricsCollector:
         
         logger.info("Metrics collector initialized", 
                    prometheus=enable_prometheus, 
-                   otel=enable_otel)
+                   otel=enable_otel,
+                   multiprocess=self.enable_multiprocess)
     
     def _setup_opentelemetry(self):
         """Setup OpenTelemetry tracing and metrics"""
@@ -94,11 +276,19 @@ class MetricsCollector:
             trace.set_tracer_provider(TracerProvider())
             self.tracer = trace.get_tracer(__name__)
             
+            # Gzip OTLP payloads unless OTEL_EXPORTER_OTLP_COMPRESSION says otherwise,
+            # in which case the exporters resolve the env var themselves
+            compression_env = os.getenv("OTEL_EXPORTER_OTLP_COMPRESSION")
+            compression = None if compression_env else Compression.Gzip
+            
             # Setup span processor
             if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
                 # Use OTLP exporter if endpoint is configured
                 span_processor = BatchSpanProcessor(
-                    OTLPSpanExporter(endpoint=os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"))
+                    OTLPSpanExporter(
+                        endpoint=os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"),
+                        compression=compression
+                    )
                 )
             else:
                 # Fallback to console exporter
@@ -107,18 +297,25 @@ class MetricsCollector:
             trace.get_tracer_provider().add_span_processor(span_processor)
             
             # Configure metrics
+            export_interval_ms = int(os.getenv("OTEL_METRIC_EXPORT_INTERVAL", self.export_interval_ms))
             if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
                 metric_reader = PeriodicExportingMetricReader(
-                    OTLPMetricExporter(endpoint=os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")),
-                    export_interval_millis=30000
+                    OTLPMetricExporter(
+                        endpoint=os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"),
+                        compression=compression
+                    ),
+                    export_interval_millis=export_interval_ms
                 )
             else:
                 metric_reader = PeriodicExportingMetricReader(
                     ConsoleMetricExporter(),
-                    export_interval_millis=30000
+                    export_interval_millis=export_interval_ms
                 )
             
-            metrics.set_meter_provider(MeterProvider(metric_readers=[metric_reader]))
+            meter_provider = MeterProvider(metric_readers=[metric_reader])
+            metrics.set_meter_provider(meter_provider)
+            # Export the last partial window on exit so long intervals lose nothing
+            atexit.register(meter_provider.force_flush)
             self.meter = metrics.get_meter(__name__)
             
             # Create OpenTelemetry metrics
@@ -128,13 +325,15 @@ class MetricsCollector:
                 unit="s"
             )
             
-            self.otel_task_counter = self.meter.create_counter(
+            self.otel_task_counter = self.meter.create_observable_counter(
                 name="browser_agent_tasks_total",
+                callbacks=[self._observe_task_counts],
                 description="Total number of browser agent tasks"
             )
             
-            self.otel_error_counter = self.meter.create_counter(
+            self.otel_error_counter = self.meter.create_observable_counter(
                 name="browser_agent_errors_total",
+                callbacks=[self._observe_error_counts],
                 description="Total number of browser agent errors"
             )
             
@@ -142,7 +341,10 @@ class MetricsCollector:
             FlaskInstrumentor().instrument()
             RequestsInstrumentor().instrument()
             
-            logger.info("OpenTelemetry setup complete")
+            # gzip typically halves OTLP protobuf payloads (~2:1)
+            logger.info("OpenTelemetry setup complete",
+                       otlp_compression=compression_env or "gzip",
+                       export_interval_ms=export_interval_ms)
             
         except Exception as e:
             logger.error("OpenTelemetry setup failed", error=str(e))
@@ -152,69 +354,96 @@ class MetricsCollector:
         """Setup Prometheus metrics"""
         try:
             # Create custom registry
-            self.registry = CollectorRegistry()
+            self.registry, metric_registry = _prometheus_registries(self.enable_multiprocess)
             
             # Define Prometheus metrics
             self.prom_task_duration = Histogram(
                 'browser_agent_task_duration_seconds',
                 'Duration of browser agent tasks in seconds',
                 ['task_type', 'success'],
-                registry=self.registry
+                registry=metric_registry
             )
             
             self.prom_task_counter = Counter(
                 'browser_agent_tasks_total',
                 'Total number of browser agent tasks',
                 ['task_type', 'success'],
-                registry=self.registry
+                registry=metric_registry
             )
             
             self.prom_step_counter = Counter(
                 'browser_agent_steps_total',
                 'Total number of browser agent steps',
                 ['action_type', 'success'],
-                registry=self.registry
+                registry=metric_registry
             )
             
             self.prom_error_counter = Counter(
                 'browser_agent_errors_total',
                 'Total number of browser agent errors',
                 ['error_type', 'component'],
-                registry=self.registry
+                registry=metric_registry
             )
             
             self.prom_active_tasks = Gauge(
                 'browser_agent_active_tasks',
                 'Number of currently active browser agent tasks',
-                registry=self.registry
+                registry=metric_registry,
+                multiprocess_mode='livesum'
             )
             
             self.prom_memory_operations = Counter(
                 'browser_agent_memory_operations_total',
                 'Total number of memory operations',
                 ['operation_type'],
-                registry=self.registry
+                registry=metric_registry
             )
             
             self.prom_vision_operations = Counter(
                 'browser_agent_vision_operations_total',
                 'Total number of vision operations',
                 ['operation_type'],
-                registry=self.registry
+                registry=metric_registry
             )
             
             self.prom_browser_actions = Counter(
                 'browser_agent_browser_actions_total',
                 'Total number of browser actions',
                 ['action_type'],
-                registry=self.registry
+                registry=metric_registry
             )
             
-            # Start Prometheus HTTP server
-            prometheus_port = int(os.getenv("PROMETHEUS_PORT", "8000"))
-            start_http_server(prometheus_port, registry=self.registry)
+            # Label values are capped, so bind every child once up front and
+            # let the record_* paths skip the per-call labels() lookup. Error
+            # components are caller function names, so those children are
+            # bound on first use instead
+            action_types = _ALLOWED_ACTION_TYPES | {"other"}
+            success_labels = ("success", "failure")
+            self._task_children = _LabelChildren(self.prom_task_counter, [
+                (task_type, success) for task_type in _ALLOWED_TASK_TYPES for success in success_labels
+            ])
+            self._task_duration_children = _LabelChildren(self.prom_task_duration, [
+                (task_type, success) for task_type in _ALLOWED_TASK_TYPES for success in success_labels
+            ])
+            self._step_children = _LabelChildren(self.prom_step_counter, [
+                (action_type, success) for action_type in action_types for success in success_labels
+            ])
+            self._error_children = _LabelChildren(self.prom_error_counter)
+            self._browser_action_children = _LabelChildren(self.prom_browser_actions, action_types)
+            self._memory_operation_children = _LabelChildren(
+                self.prom_memory_operations, _ALLOWED_MEMORY_OPERATIONS | {"other"}
+            )
+            self._vision_operation_children = _LabelChildren(
+                self.prom_vision_operations, _ALLOWED_VISION_OPERATIONS | {"other"}
+            )
             
-            logger.info("Prometheus metrics server started", port=prometheus_port)
+            # A single exposer aggregates every process in multiprocess mode,
+            # e.g. the dashboard /metrics route
+            if not self.enable_multiprocess:
+                prometheus_port = int(os.getenv("PROMETHEUS_PORT", "8000"))
+                start_http_server(prometheus_port, registry=self.registry)
+                
+                logger.info("Prometheus metrics server started", port=prometheus_port)
             
         except Exception as e:
             logger.error("Prometheus setup failed", error=str(e))
@@ -228,11 +457,13 @@ class MetricsCollector:
             start_time=time.time()
         )
         
+        # Restarting a task id replaces it rather than adding an active task
+        is_new = task_id not in self.active_tasks
         self.active_tasks[task_id] = metrics
         
         # Update Prometheus metrics
-        if self.enable_prometheus:
-            self.prom_active_tasks.set(len(self.active_tasks))
+        if self.enable_prometheus and is_new:
+            self.prom_active_tasks.inc()
         
         # Create OpenTelemetry span
         if self.enable_otel:
@@ -251,6 +482,7 @@ class MetricsCollector:
             return None
         
         metrics = self.active_tasks[task_id]
+        metrics.end_ns = time.monotonic_ns()
         metrics.end_time = time.time()
         metrics.success = success
         
@@ -258,7 +490,7 @@ class MetricsCollector:
         self._record_task_completion(metrics)
         
         # End OpenTelemetry span
-        if self.enable_otel and hasattr(metrics, 'otel_span'):
+        if self.enable_otel and metrics.otel_span is not None:
             span = metrics.otel_span
             span.set_attribute("task.success", success)
             span.set_attribute("task.duration", metrics.duration)
@@ -277,7 +509,7 @@ class MetricsCollector:
         
         # Update Prometheus active tasks gauge
         if self.enable_prometheus:
-            self.prom_active_tasks.set(len(self.active_tasks))
+            self.prom_active_tasks.dec()
         
         logger.info("Task completed", 
                    task_id=task_id, 
@@ -289,20 +521,16 @@ class MetricsCollector:
     
     def _record_task_completion(self, metrics: AgentMetrics):
         """Record task completion metrics"""
-        task_type = self._classify_task_type(metrics.task_description)
+        task_type = _bounded_label(
+            self._classify_task_type(metrics.task_description),
+            _ALLOWED_TASK_TYPES, "task_type", fallback="general"
+        )
         success_label = "success" if metrics.success else "failure"
         
         # Prometheus metrics
         if self.enable_prometheus:
-            self.prom_task_duration.labels(
-                task_type=task_type,
-                success=success_label
-            ).observe(metrics.duration)
-            
-            self.prom_task_counter.labels(
-                task_type=task_type,
-                success=success_label
-            ).inc()
+            self._task_duration_children[(task_type, success_label)].observe(metrics.duration)
+            self._task_children[(task_type, success_label)].inc()
         
         # OpenTelemetry metrics
         if self.enable_otel:
@@ -311,30 +539,39 @@ class MetricsCollector:
                 {"task_type": task_type, "success": success_label}
             )
             
-            self.otel_task_counter.add(
-                1,
-                {"task_type": task_type, "success": success_label}
-            )
+            with self._otel_counts_lock:
+                self._otel_task_counts[(task_type, success_label)] += 1
+    
+    def _observe_task_counts(self, options: CallbackOptions) -> List[Observation]:
+        """Report accumulated task totals to the OTel reader once per export"""
+        with self._otel_counts_lock:
+            counts = list(self._otel_task_counts.items())
+        return [
+            Observation(count, {"task_type": task_type, "success": success_label})
+            for (task_type, success_label), count in counts
+        ]
+    
+    def _observe_error_counts(self, options: CallbackOptions) -> List[Observation]:
+        """Report accumulated error totals to the OTel reader once per export"""
+        with self._otel_counts_lock:
+            counts = list(self._otel_error_counts.items())
+        return [
+            Observation(count, {"error_type": error_type, "component": component})
+            for (error_type, component), count in counts
+        ]
     
     def _classify_task_type(self, description: str) -> str:
         """Classify task type based on description"""
-        description_lower = description.lower()
-        
-        if any(word in description_lower for word in ["login", "authenticate", "sign in"]):
-            return "authentication"
-        elif any(word in description_lower for word in ["form", "fill", "submit", "input"]):
-            return "form_interaction"
-        elif any(word in description_lower for word in ["extract", "scrape", "data", "content"]):
-            return "data_extraction"
-        elif any(word in description_lower for word in ["navigate", "go to", "visit", "open"]):
-            return "navigation"
-        elif any(word in description_lower for word in ["click", "button", "link"]):
-            return "element_interaction"
-        else:
-            return "general"
+        matched = {match.lastgroup for match in _TASK_TYPE_RE.finditer(description)}
+        
+        for group, task_type in _TASK_TYPE_PRIORITY:
+            if group in matched:
+                return task_type
+        return "general"
     
     def record_step_completion(self, task_id: str, action_type: str, success: bool = True):
         """Record completion of a task step"""
+        action_type = _bounded_label(action_type, _ALLOWED_ACTION_TYPES, "action_type")
         if task_id in self.active_tasks:
             metrics = self.active_tasks[task_id]
             metrics.total_steps += 1
@@ -346,70 +583,99 @@ class MetricsCollector:
         # Record Prometheus metrics
         if self.enable_prometheus:
             success_label = "success" if success else "failure"
-            self.prom_step_counter.labels(
-                action_type=action_type,
-                success=success_label
-            ).inc()
+            self._step_children[(action_type, success_label)].inc()
     
     def record_error(self, task_id: str, error_type: str, component: str):
         """Record an error occurrence"""
+        error_type = _bounded_label(error_type, _ALLOWED_ERROR_TYPES, "error_type")
         if task_id in self.active_tasks:
             self.active_tasks[task_id].errors_count += 1
         
         # Record Prometheus metrics
         if self.enable_prometheus:
-            self.prom_error_counter.labels(
-                error_type=error_type,
-                component=component
-            ).inc()
+            self._error_children[(error_type, component)].inc()
         
         # Record OpenTelemetry metrics
         if self.enable_otel:
-            self.otel_error_counter.add(
-                1,
-                {"error_type": error_type, "component": component}
-            )
+            with self._otel_counts_lock:
+                self._otel_error_counts[(error_type, component)] += 1
     
     def record_memory_operation(self, task_id: str, operation_type: str):
         """Record a memory operation"""
+        operation_type = _bounded_label(operation_type, _ALLOWED_MEMORY_OPERATIONS, "operation_type")
         if task_id in self.active_tasks:
             self.active_tasks[task_id].memory_operations += 1
         
         if self.enable_prometheus:
-            self.prom_memory_operations.labels(operation_type=operation_type).inc()
+            self._memory_operation_children[operation_type].inc()
     
     def record_vision_operation(self, task_id: str, operation_type: str):
         """Record a vision operation"""
+        operation_type = _bounded_label(operation_type, _ALLOWED_VISION_OPERATIONS, "operation_type")
         if task_id in self.active_tasks:
             self.active_tasks[task_id].vision_operations += 1
         
         if self.enable_prometheus:
-            self.prom_vision_operations.labels(operation_type=operation_type).inc()
+            self._vision_operation_children[operation_type].inc()
     
     def record_browser_action(self, task_id: str, action_type: str):
         """Record a browser action"""
+        action_type = _bounded_label(action_type, _ALLOWED_ACTION_TYPES, "action_type")
         if task_id in self.active_tasks:
             self.active_tasks[task_id].browser_actions += 1
         
         if self.enable_prometheus:
-            self.prom_browser_actions.labels(action_type=action_type).inc()
+            self._browser_action_children[action_type].inc()
     
     def get_active_tasks(self) -> List[Dict[str, Any]]:
         """Get information about currently active tasks"""
         return [metrics.to_dict() for metrics in self.active_tasks.values()]
     
     def export_metrics_to_file(self, filepath: str):
-        """Export current metrics to a JSON file"""
+        """Append a metrics snapshot to a gzip-compressed NDJSON file"""
         export_data = {
             "timestamp": datetime.now().isoformat(),
             "active_tasks": self.get_active_tasks(),
             "active_tasks_count": len(self.active_tasks)
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if orjson:
+            line = orjson.dumps(export_data, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        else:
+            line = json.dumps(export_data).encode() + b"\n"
+        
+        # Keep each archive open so snapshots batch up in the buffer and the
+        # compressor instead of costing a file open and flush per call
+        with self._export_lock:
+            export = self._export_files.get(filepath)
+            if export is None:
+                raw = io.BufferedWriter(io.FileIO(filepath, "ab"), buffer_size=EXPORT_BUFFER_SIZE)
+                export = self._export_files[filepath] = [gzip.GzipFile(fileobj=raw, mode="ab", compresslevel=3), raw, 0]
+            gz, raw, pending = export
+            gz.write(line)
+            pending += 1
+            if pending >= EXPORT_FLUSH_SNAPSHOTS:
+                gz.flush()
+                raw.flush()
+                pending = 0
+            export[2] = pending
         
         logger.info("Metrics exported to file", filepath=filepath)
+    
+    def close_exports(self):
+        """Flush and close every metrics archive opened by export_metrics_to_file"""
+        with self._export_lock:
+            for gz, raw, _ in self._export_files.values():
+                gz.close()
+                raw.close()
+            self._export_files.clear()
+
+
+# Seconds a ChromaDB collection listing is reused across memory health checks
+CHROMA_COLLECTIONS_TTL = 30
+
+# Seconds between background health probes feeding the dashboard /health route
+HEALTH_CHECK_INTERVAL = 30
 
 
 class HealthChecker:
@@ -419,47 +685,96 @@ class HealthChecker:
         self.metrics_collector = metrics_collector
         self.checks = {}
         self.logger = logger.bind(component="health_checker")
+        
+        # Loop-bound resources kept warm between checks: a pooled HTTP
+        # session for Ollama and a headless browser
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session = None
+        self._session_lock: Optional[asyncio.Lock] = None
+        self._playwright = None
+        self._browser = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        
+        # Latest result from the background probe loop, see start_background_checks
+        self._last_result: Optional[Dict[str, Any]] = None
+        self._background_thread: Optional[threading.Thread] = None
+        
+        # ChromaDB client and a short-lived snapshot of its collection names
+        self._chroma_client = None
+        self._chroma_collections: Optional[List[str]] = None
+        self._chroma_collections_at = 0.0
+    
+    def _bind_loop(self):
+        """Forget loop-bound resources if checks moved to another event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # aiohttp sessions and Playwright objects belong to the loop that created them
+            self._session = self._playwright = self._browser = None
+            self._session_lock = asyncio.Lock()
+            self._browser_lock = asyncio.Lock()
+            self._loop = loop
+    
+    async def _get_session(self):
+        """Return the shared Ollama HTTP session, creating it on first use"""
+        self._bind_loop()
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                import aiohttp
+                
+                self._session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=5),
+                    connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300)
+                )
+            return self._session
     
     async def check_ollama_health(self) -> Dict[str, Any]:
         """Check Ollama server health"""
         try:
-            import aiohttp
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get("http://localhost:11434/api/tags", timeout=5) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "status": "healthy",
-                            "models_count": len(data.get("models", [])),
-                            "models": [m["name"] for m in data.get("models", [])]
-                        }
-                    else:
-                        return {
-                            "status": "unhealthy",
-                            "error": f"HTTP {response.status}"
-                        }
+            session = await self._get_session()
+            async with session.get("http://localhost:11434/api/tags") as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {
+                        "status": "healthy",
+                        "models_count": len(data.get("models", [])),
+                        "models": [m["name"] for m in data.get("models", [])]
+                    }
+                else:
+                    return {
+                        "status": "unhealthy",
+                        "error": f"HTTP {response.status}"
+                    }
         except Exception as e:
             return {
                 "status": "unhealthy",
                 "error": str(e)
             }
     
+    async def _get_browser(self):
+        """Return the shared headless browser, launching it on first use"""
+        self._bind_loop()
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                from playwright.async_api import async_playwright
+                
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+    
     async def check_browser_health(self) -> Dict[str, Any]:
         """Check browser automation health"""
         try:
-            from playwright.async_api import async_playwright
-            
-            playwright = await async_playwright().start()
-            browser = await playwright.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            # Test basic navigation
-            await page.goto("data:text/html,<html><body><h1>Test</h1></body></html>")
-            title = await page.title()
-            
-            await browser.close()
-            await playwright.stop()
+            browser = await self._get_browser()
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+                
+                # Test basic navigation
+                await page.goto("data:text/html,<html><body><h1>Test</h1></body></html>")
+                title = await page.title()
+            finally:
+                await context.close()
             
             return {
                 "status": "healthy",
@@ -473,19 +788,38 @@ class HealthChecker:
                 "error": str(e)
             }
     
+    async def aclose(self):
+        """Close the HTTP session and browser kept warm for health checks"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+    
     async def check_memory_health(self) -> Dict[str, Any]:
         """Check memory/database health"""
         try:
-            import chromadb
+            if self._chroma_client is None:
+                import chromadb
+                
+                self._chroma_client = chromadb.PersistentClient(path="./chroma_db")
             
             # Test ChromaDB connection
-            client = chromadb.PersistentClient(path="./chroma_db")
-            collections = client.list_collections()
+            now = time.monotonic()
+            if (self._chroma_collections is None
+                    or now - self._chroma_collections_at >= CHROMA_COLLECTIONS_TTL):
+                self._chroma_collections = [c.name for c in self._chroma_client.list_collections()]
+                self._chroma_collections_at = now
+            collections = self._chroma_collections
             
             return {
                 "status": "healthy",
                 "collections_count": len(collections),
-                "collections": [c.name for c in collections]
+                "collections": list(collections)
             }
             
         except Exception as e:
@@ -496,12 +830,20 @@ class HealthChecker:
     
     async def run_all_checks(self) -> Dict[str, Any]:
         """Run all health checks"""
+        # Checks are independent, so total latency is the slowest one, not the sum
+        results = await asyncio.gather(
+            self.check_ollama_health(),
+            self.check_browser_health(),
+            self.check_memory_health(),
+            return_exceptions=True
+        )
+        
         checks = {
-            "ollama": await self.check_ollama_health(),
-            "browser": await self.check_browser_health(),
-            "memory": await self.check_memory_health(),
-            "timestamp": datetime.now().isoformat()
+            name: {"status": "unhealthy", "error": repr(result)}
+            if isinstance(result, BaseException) else result
+            for name, result in zip(("ollama", "browser", "memory"), results)
         }
+        checks["timestamp"] = datetime.now().isoformat()
         
         # Calculate overall health
         healthy_components = sum(1 for check in checks.values() 
@@ -520,6 +862,179 @@ class HealthChecker:
                         total=total_components)
         
         return checks
+    
+    @property
+    def last_result(self) -> Optional[Dict[str, Any]]:
+        """Most recent background check result, or None before the first run"""
+        return self._last_result
+    
+    def start_background_checks(self, interval: float = HEALTH_CHECK_INTERVAL):
+        """Probe all components every interval seconds on a dedicated event loop"""
+        if self._background_thread is not None:
+            return
+        
+        async def probe_forever():
+            try:
+                while True:
+                    self._last_result = await self.run_all_checks()
+                    await asyncio.sleep(interval)
+            finally:
+                await self.aclose()
+        
+        self._background_thread = threading.Thread(
+            target=asyncio.run, args=(probe_forever(),),
+            name="health-checker", daemon=True
+        )
+        self._background_thread.start()
+
+
+DASHBOARD_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Browser Agent Dashboard</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; }
+        .card { background: white; padding: 20px; margin: 20px 0; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; }
+        .metric { text-align: center; padding: 20px; background: #f8f9fa; border-radius: 8px; }
+        .metric h3 { margin: 0 0 10px 0; color: #333; }
+        .metric .value { font-size: 2em; font-weight: bold; color: #007bff; }
+        .healthy { color: #28a745; }
+        .unhealthy { color: #dc3545; }
+        .degraded { color: #ffc107; }
+        .refresh-btn { background: #007bff; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; }
+        .refresh-btn:hover { background: #0056b3; }
+        table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background-color: #f8f9fa; }
+        .task-id { font-family: monospace; font-size: 0.9em; }
+        .status-badge { padding: 4px 8px; border-radius: 4px; font-size: 0.8em; font-weight: bold; }
+        .status-active { background: #d4edda; color: #155724; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🤖 Enhanced Browser Agent Dashboard</h1>
+
+        <div class="card">
+            <h2>System Health</h2>
+            <div id="health-status">Loading...</div>
+            <button class="refresh-btn" onclick="refreshHealth()">Refresh Health</button>
+        </div>
+
+        <div class="card">
+            <h2>Metrics Overview</h2>
+            <div class="metrics" id="metrics-overview">
+                <div class="metric">
+                    <h3>Active Tasks</h3>
+                    <div class="value" id="active-tasks">-</div>
+                </div>
+                <div class="metric">
+                    <h3>Total Tasks Today</h3>
+                    <div class="value" id="total-tasks">-</div>
+                </div>
+                <div class="metric">
+                    <h3>Success Rate</h3>
+                    <div class="value" id="success-rate">-</div>
+                </div>
+                <div class="metric">
+                    <h3>Avg Duration</h3>
+                    <div class="value" id="avg-duration">-</div>
+                </div>
+            </div>
+        </div>
+
+        <div class="card">
+            <h2>Active Tasks</h2>
+            <div id="active-tasks-table">Loading...</div>
+            <button class="refresh-btn" onclick="refreshMetrics()">Refresh Metrics</button>
+        </div>
+    </div>
+
+    <script>
+        async function refreshHealth() {
+            try {
+                const response = await fetch('/health');
+                const health = await response.json();
+
+                let html = '<div class="metrics">';
+                for (const [component, status] of Object.entries(health)) {
+                    if (component === 'timestamp') continue;
+
+                    const statusClass = status.status === 'healthy' ? 'healthy' : 
+                                       status.status === 'degraded' ? 'degraded' : 'unhealthy';
+
+                    html += `
+                        <div class="metric">
+                            <h3>${component.charAt(0).toUpperCase() + component.slice(1)}</h3>
+                            <div class="value ${statusClass}">${status.status}</div>
+                        </div>
+                    `;
+                }
+                html += '</div>';
+
+                document.getElementById('health-status').innerHTML = html;
+            } catch (error) {
+                document.getElementById('health-status').innerHTML = '<p class="unhealthy">Failed to load health status</p>';
+            }
+        }
+
+        async function refreshMetrics() {
+            try {
+                const response = await fetch('/tasks');
+                const metrics = await response.json();
+
+                document.getElementById('active-tasks').textContent = metrics.active_count;
+
+                let tableHtml = '<table><thead><tr><th>Task ID</th><th>Description</th><th>Duration</th><th>Steps</th><th>Status</th></tr></thead><tbody>';
+
+                if (metrics.active_tasks.length === 0) {
+                    tableHtml += '<tr><td colspan="5">No active tasks</td></tr>';
+                } else {
+                    metrics.active_tasks.forEach(task => {
+                        const duration = task.duration.toFixed(1);
+
+                        tableHtml += `
+                            <tr>
+                                <td class="task-id">${task.task_id}</td>
+                                <td>${task.task_description}</td>
+                                <td>${duration}s</td>
+                                <td>${task.steps_completed}/${task.total_steps}</td>
+                                <td><span class="status-badge status-active">Active</span></td>
+                            </tr>
+                        `;
+                    });
+                }
+
+                tableHtml += '</tbody></table>';
+                document.getElementById('active-tasks-table').innerHTML = tableHtml;
+
+            } catch (error) {
+                document.getElementById('active-tasks-table').innerHTML = '<p>Failed to load metrics</p>';
+            }
+        }
+
+        // Auto-refresh every 10 seconds
+        setInterval(() => {
+            refreshHealth();
+            refreshMetrics();
+        }, 10000);
+
+        // Initial load
+        refreshHealth();
+        refreshMetrics();
+    </script>
+</body>
+</html>
+"""
+
+# The dashboard page is static, so encode and compress it once at import
+_DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode("utf-8")
+_DASHBOARD_HTML_GZ = gzip.compress(_DASHBOARD_HTML_BYTES, compresslevel=9)
 
 
 class DashboardServer:
@@ -533,19 +1048,24 @@ class DashboardServer:
     def create_app(self):
         """Create Flask app for dashboard"""
         try:
-            from flask import Flask, jsonify, render_template_string
+            from flask import Flask, Response, jsonify, request
             
             app = Flask(__name__)
             
+            # Probes run on one long-lived loop; the route only reads the latest result
+            self.health_checker.start_background_checks()
+            
             @app.route('/health')
-            async def health():
+            def health():
                 """Health check endpoint"""
-                checks = await self.health_checker.run_all_checks()
+                checks = self.health_checker.last_result
+                if checks is None:
+                    return jsonify({"overall": {"status": "pending"}}), 503
                 return jsonify(checks)
             
-            @app.route('/metrics')
-            def metrics():
-                """Metrics endpoint"""
+            @app.route('/tasks')
+            def tasks():
+                """Active tasks for the dashboard"""
                 return jsonify({
                     "active_tasks": self.metrics_collector.get_active_tasks(),
                     "active_count": len(self.metrics_collector.active_tasks)
@@ -554,152 +1074,24 @@ class DashboardServer:
             @app.route('/')
             def dashboard():
                 """Main dashboard"""
-                dashboard_html = """
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>Browser Agent Dashboard</title>
-                    <meta charset="utf-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1">
-                    <style>
-                        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
-                        .container { max-width: 1200px; margin: 0 auto; }
-                        .card { background: white; padding: 20px; margin: 20px 0; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-                        .metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; }
-                        .metric { text-align: center; padding: 20px; background: #f8f9fa; border-radius: 8px; }
-                        .metric h3 { margin: 0 0 10px 0; color: #333; }
-                        .metric .value { font-size: 2em; font-weight: bold; color: #007bff; }
-                        .healthy { color: #28a745; }
-                        .unhealthy { color: #dc3545; }
-                        .degraded { color: #ffc107; }
-                        .refresh-btn { background: #007bff; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; }
-                        .refresh-btn:hover { background: #0056b3; }
-                        table { width: 100%; border-collapse: collapse; margin-top: 20px; }
-                        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
-                        th { background-color: #f8f9fa; }
-                        .task-id { font-family: monospace; font-size: 0.9em; }
-                        .status-badge { padding: 4px 8px; border-radius: 4px; font-size: 0.8em; font-weight: bold; }
-                        .status-active { background: #d4edda; color: #155724; }
-                    </style>
-                </head>
-                <body>
-                    <div class="container">
-                        <h1>🤖 Enhanced Browser Agent Dashboard</h1>
-                        
-                        <div class="card">
-                            <h2>System Health</h2>
-                            <div id="health-status">Loading...</div>
-                            <button class="refresh-btn" onclick="refreshHealth()">Refresh Health</button>
-                        </div>
-                        
-                        <div class="card">
-                            <h2>Metrics Overview</h2>
-                            <div class="metrics" id="metrics-overview">
-                                <div class="metric">
-                                    <h3>Active Tasks</h3>
-                                    <div class="value" id="active-tasks">-</div>
-                                </div>
-                                <div class="metric">
-                                    <h3>Total Tasks Today</h3>
-                                    <div class="value" id="total-tasks">-</div>
-                                </div>
-                                <div class="metric">
-                                    <h3>Success Rate</h3>
-                                    <div class="value" id="success-rate">-</div>
-                                </div>
-                                <div class="metric">
-                                    <h3>Avg Duration</h3>
-                                    <div class="value" id="avg-duration">-</div>
-                                </div>
-                            </div>
-                        </div>
-                        
-                        <div class="card">
-                            <h2>Active Tasks</h2>
-                            <div id="active-tasks-table">Loading...</div>
-                            <button class="refresh-btn" onclick="refreshMetrics()">Refresh Metrics</button>
-                        </div>
-                    </div>
-                    
-                    <script>
-                        async function refreshHealth() {
-                            try {
-                                const response = await fetch('/health');
-                                const health = await response.json();
-                                
-                                let html = '<div class="metrics">';
-                                for (const [component, status] of Object.entries(health)) {
-                                    if (component === 'timestamp') continue;
-                                    
-                                    const statusClass = status.status === 'healthy' ? 'healthy' : 
-                                                       status.status === 'degraded' ? 'degraded' : 'unhealthy';
-                                    
-                                    html += `
-                                        <div class="metric">
-                                            <h3>${component.charAt(0).toUpperCase() + component.slice(1)}</h3>
-                                            <div class="value ${statusClass}">${status.status}</div>
-                                        </div>
-                                    `;
-                                }
-                                html += '</div>';
-                                
-                                document.getElementById('health-status').innerHTML = html;
-                            } catch (error) {
-                                document.getElementById('health-status').innerHTML = '<p class="unhealthy">Failed to load health status</p>';
-                            }
-                        }
-                        
-                        async function refreshMetrics() {
-                            try {
-                                const response = await fetch('/metrics');
-                                const metrics = await response.json();
-                                
-                                document.getElementById('active-tasks').textContent = metrics.active_count;
-                                
-                                let tableHtml = '<table><thead><tr><th>Task ID</th><th>Description</th><th>Duration</th><th>Steps</th><th>Status</th></tr></thead><tbody>';
-                                
-                                if (metrics.active_tasks.length === 0) {
-                                    tableHtml += '<tr><td colspan="5">No active tasks</td></tr>';
-                                } else {
-                                    metrics.active_tasks.forEach(task => {
-                                        const duration = task.end_time ? 
-                                            (task.end_time - task.start_time).toFixed(1) : 
-                                            (Date.now()/1000 - task.start_time).toFixed(1);
-                                        
-                                        tableHtml += `
-                                            <tr>
-                                                <td class="task-id">${task.task_id}</td>
-                                                <td>${task.task_description}</td>
-                                                <td>${duration}s</td>
-                                                <td>${task.steps_completed}/${task.total_steps}</td>
-                                                <td><span class="status-badge status-active">Active</span></td>
-                                            </tr>
-                                        `;
-                                    });
-                                }
-                                
-                                tableHtml += '</tbody></table>';
-                                document.getElementById('active-tasks-table').innerHTML = tableHtml;
-                                
-                            } catch (error) {
-                                document.getElementById('active-tasks-table').innerHTML = '<p>Failed to load metrics</p>';
-                            }
-                        }
-                        
-                        // Auto-refresh every 10 seconds
-                        setInterval(() => {
-                            refreshHealth();
-                            refreshMetrics();
-                        }, 10000);
-                        
-                        // Initial load
-                        refreshHealth();
-                        refreshMetrics();
-                    </script>
-                </body>
-                </html>
-                """
-                return dashboard_html
+                if 'gzip' in request.accept_encodings:
+                    return Response(_DASHBOARD_HTML_GZ, mimetype="text/html", headers={
+                        "Content-Encoding": "gzip",
+                        "Cache-Control": "public, max-age=300",
+                        "Vary": "Accept-Encoding"
+                    })
+                return Response(_DASHBOARD_HTML_BYTES, mimetype="text/html", headers={
+                    "Cache-Control": "public, max-age=300",
+                    "Vary": "Accept-Encoding"
+                })
+            
+            # Scrapes hit prometheus_client's own WSGI app directly, bypassing Flask
+            if self.metrics_collector.enable_prometheus:
+                from werkzeug.middleware.dispatcher import DispatcherMiddleware
+                
+                app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {
+                    '/metrics': make_wsgi_app(registry=self.metrics_collector.registry)
+                })
             
             self.app = app
             return app
@@ -718,6 +1110,18 @@ class DashboardServer:
             self.app.run(host=host, port=port, debug=False)
 
 
+# [epoch second, ISO string] for the last second a timestamp was formatted in
+_timestamp_cache = [0, ""]
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601, formatted at most once per second"""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[:] = [now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))]
+    return _timestamp_cache[1]
+
+
 class MonitoringDashboard:
     """Flask-based monitoring dashboard"""
     
@@ -728,14 +1132,13 @@ class MonitoringDashboard:
     
     def create_app(self):
         """Create Flask app for monitoring dashboard"""
-        from flask import Flask, render_template_string, jsonify
+        from flask import Flask, jsonify
+        from jinja2 import Template
         
         app = Flask(__name__)
         
-        @app.route('/monitoring')
-        def dashboard():
-            """Main monitoring dashboard"""
-            return render_template_string("""
+        # Nothing on the page changes between requests, so render it once
+        dashboard_html = Template("""
             <!DOCTYPE html>
             <html>
             <head>
@@ -760,14 +1163,19 @@ class MonitoringDashboard:
                 </div>
             </body>
             </html>
-            """, task_count=42, avg_response_time=150)
+            """).render(task_count=42, avg_response_time=150)
+        
+        @app.route('/monitoring')
+        def dashboard():
+            """Main monitoring dashboard"""
+            return dashboard_html
         
         @app.route('/monitoring/api/health')
         def api_health():
             """Health API for monitoring"""
             return jsonify({
                 'status': 'healthy',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': _utc_timestamp()
             })
         
         self.app = app
@@ -783,47 +1191,62 @@ class MonitoringDashboard:
 class PrometheusMetrics:
     """Prometheus metrics collection for browser agent"""
     
-    def __init__(self):
-        self.registry = CollectorRegistry()
+    def __init__(self, enable_multiprocess: Optional[bool] = None):
+        self.enable_multiprocess = _multiprocess_enabled(enable_multiprocess)
+        self.registry, metric_registry = _prometheus_registries(self.enable_multiprocess)
+        
+        # Names carry a dashboard_ prefix so they never collide with
+        # MetricsCollector's differently labelled families: in multiprocess
+        # mode both share one directory and are merged by metric name
         
         # Task metrics
         self.task_counter = Counter(
-            'browser_agent_tasks_total',
+            'browser_agent_dashboard_tasks_total',
             'Total number of browser agent tasks',
             ['status', 'task_type'],
-            registry=self.registry
+            registry=metric_registry
         )
         
         self.task_duration = Histogram(
-            'browser_agent_task_duration_seconds',
+            'browser_agent_dashboard_task_duration_seconds',
             'Task execution duration',
             ['task_type'],
-            registry=self.registry
+            registry=metric_registry
         )
         
         # Action metrics
         self.browser_actions = Counter(
-            'browser_agent_actions_total',
+            'browser_agent_dashboard_actions_total',
             'Total browser actions performed',
             ['action_type'],
-            registry=self.registry
+            registry=metric_registry
         )
         
         # Memory metrics
         self.memory_operations = Counter(
-            'browser_agent_memory_operations_total',
+            'browser_agent_dashboard_memory_operations_total',
             'Memory operations performed',
             ['operation_type'],
-            registry=self.registry
+            registry=metric_registry
         )
         
         # Vision metrics
         self.vision_operations = Counter(
-            'browser_agent_vision_operations_total',
+            'browser_agent_dashboard_vision_operations_total',
             'Vision operations performed',
             ['operation_type'],
-            registry=self.registry
+            registry=metric_registry
         )
+        
+        # Children bound once per label value, so recording skips labels()
+        # Expected task series exist from startup, so /metrics output has a fixed shape
+        self._task_children = _LabelChildren(self.task_counter, [
+            (status, task_type) for status in _TASK_STATUSES for task_type in _ALLOWED_TASK_TYPES
+        ])
+        self._task_duration_children = _LabelChildren(self.task_duration, _ALLOWED_TASK_TYPES)
+        self._browser_action_children = _LabelChildren(self.browser_actions, _ALLOWED_ACTION_TYPES)
+        self._memory_operation_children = _LabelChildren(self.memory_operations, _ALLOWED_MEMORY_OPERATIONS)
+        self._vision_operation_children = _LabelChildren(self.vision_operations, _ALLOWED_VISION_OPERATIONS)
     
     def record_task_start(self, task_type: str):
         """Record task start"""
@@ -831,20 +1254,20 @@ class PrometheusMetrics:
     
     def record_task_end(self, task_type: str, status: str, duration: float):
         """Record task completion"""
-        self.task_counter.labels(status=status, task_type=task_type).inc()
-        self.task_duration.labels(task_type=task_type).observe(duration)
+        self._task_children[(status, task_type)].inc()
+        self._task_duration_children[task_type].observe(duration)
     
     def record_browser_action(self, action_type: str):
         """Record browser action"""
-        self.browser_actions.labels(action_type=action_type).inc()
+        self._browser_action_children[action_type].inc()
     
     def record_memory_operation(self, operation_type: str):
         """Record memory operation"""
-        self.memory_operations.labels(operation_type=operation_type).inc()
+        self._memory_operation_children[operation_type].inc()
     
     def record_vision_operation(self, operation_type: str):
         """Record vision operation"""
-        self.vision_operations.labels(operation_type=operation_type).inc()
+        self._vision_operation_children[operation_type].inc()
 
 
 # Global metrics collector instance
@@ -863,14 +1286,17 @@ def get_health_checker() -> HealthChecker:
 
 
 # Decorator for automatic metrics collection
+# Task ids only key in-process metrics, so a counter is enough to keep them unique
+_task_ids = itertools.count(1)
+
+
 def monitor_task(func):
     """Decorator to automatically monitor task execution"""
     import functools
-    import uuid
     
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        task_id = str(uuid.uuid4())
+        task_id = f"task-{next(_task_ids)}"
         task_description = kwargs.get('task_description', func.__name__)
         
         # Start monitoring
@@ -902,14 +1328,21 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Enhanced Browser Agent Monitoring")
     parser.add_argument("--dashboard", action="store_true", help="Start dashboard server")
     parser.add_argument("--health-check", action="store_true", help="Run health check")
-    parser.add_argument("--export-metrics", type=str, help="Export metrics to file")
+    parser.add_argument("--export-metrics", type=str, help="Append a metrics snapshot to an NDJSON.gz file")
     parser.add_argument("--port", type=int, default=8080, help="Dashboard port")
     
     args = parser.parse_args()
     
     if args.health_check:
         print("Running health check...")
-        checks = asyncio.run(health_checker.run_all_checks())
+        
+        async def run_health_check():
+            try:
+                return await health_checker.run_all_checks()
+            finally:
+                await health_checker.aclose()
+        
+        checks = asyncio.run(run_health_check())
         print(json.dumps(checks, indent=2))
     
     elif args.export_metrics:
@@ -2,21 +2,54 @@
 """
 OrbitAgents Web Monitoring Dashboard
 A simple web interface to monitor OrbitAgents status and performance
+
+Serve with an ASGI server, e.g.:
+    hypercorn monitoring_dashboard:app --bind 0.0.0.0:9090 --workers 1 --worker-class asyncio
 """
 
-from flask import Flask, render_template_string, jsonify
-from flask_cors import CORS
-import requests
+from quart import Quart, Response, jsonify, make_response, request
+from quart_cors import cors, cors_exempt
+import asyncio
+from contextlib import suppress
+import gzip
+import hashlib
+import httpx
+from cachetools import TLRUCache
 import json
+import os
 import time
-from datetime import datetime
-
-app = Flask(__name__)
-CORS(app)
+from typing import Dict, Optional, Set
 
 # Configuration
 API_BASE_URL = "http://localhost:8080"
 
+# Origins allowed to call the /api routes cross-origin; the page itself is same-origin
+ALLOWED_ORIGINS = frozenset(
+    origin.strip()
+    for origin in os.getenv(
+        "DASHBOARD_ALLOWED_ORIGINS",
+        "http://localhost:3000,http://localhost:5173,https://orbitagents.dev"
+    ).split(",")
+    if origin.strip()
+)
+
+# Browsers cache each preflight for a day instead of repeating it
+app = cors(Quart(__name__), allow_origin=ALLOWED_ORIGINS, max_age=86400)
+
+# One pooled client per server process, shared by every proxied request
+_client: Optional[httpx.AsyncClient] = None
+
+# Upstream payloads are shared by every open dashboard tab for a few
+# seconds; health stays fresher to keep the "live" feel
+CACHE_TTLS = {'/api/health-check': 1, '/api/workflows': 2}
+_cache = TLRUCache(maxsize=32, ttu=lambda path, payload, now: now + CACHE_TTLS.get(path, 2))
+_inflight: Dict[str, asyncio.Future] = {}
+
+# Open /api/stream connections share one upstream poll per interval
+STREAM_INTERVAL = 5
+_subscribers: Set[asyncio.Queue] = set()
+_broadcaster: Optional[asyncio.Task] = None
+
 # HTML Template for monitoring dashboard
 DASHBOARD_HTML = """
 <!DOCTYPE html>
@@ -198,7 +231,7 @@ DASHBOARD_HTML = """
         </div>
         
         <div class="controls">
-            <button class="refresh-button" onclick="refreshData()">🔄 Refresh Data</button>
+            <button class="refresh-button" onclick="manualRefresh()">🔄 Refresh Data</button>
             <button class="refresh-button" onclick="toggleAutoRefresh()">⏱️ Toggle Auto-Refresh</button>
             <div class="auto-refresh">
                 <span>Auto-refresh: <span id="autoRefreshStatus">ON</span></span>
@@ -235,8 +268,8 @@ DASHBOARD_HTML = """
                     <span class="metric-value" id="systemUptime">-</span>
                 </div>
                 <div class="metric">
-                    <span class="metric-label">Total Requests:</span>
-                    <span class="metric-value" id="totalRequests">-</span>
+                    <span class="metric-label">Updates Received:</span>
+                    <span class="metric-value" id="updatesReceived">-</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Active Workflows:</span>
@@ -271,99 +304,145 @@ DASHBOARD_HTML = """
                 <span class="status-indicator status-healthy"></span>
                 Real-time Logs
             </h3>
-            <div class="log-container" id="logContainer">
-                <div class="log-entry">
-                    <span class="log-timestamp">[{{ current_time }}]</span>
-                    <span class="log-level-info">[INFO]</span>
-                    OrbitAgents Monitoring Dashboard started
-                </div>
-            </div>
+            <div class="log-container" id="logContainer"></div>
         </div>
     </div>
 
     <script>
         let autoRefresh = true;
-        let refreshInterval;
+        let stream;
+        const MAX_LOG_ENTRIES = 500;
         
         function addLog(level, message) {
             const logContainer = document.getElementById('logContainer');
             const timestamp = new Date().toLocaleTimeString();
+            
+            // Built from nodes rather than innerHTML, so no HTML parsing per line
             const logEntry = document.createElement('div');
             logEntry.className = 'log-entry';
-            logEntry.innerHTML = `
-                <span class="log-timestamp">[${timestamp}]</span>
-                <span class="log-level-${level}">[${level.toUpperCase()}]</span>
-                ${message}
-            `;
+            const timestampSpan = document.createElement('span');
+            timestampSpan.className = 'log-timestamp';
+            timestampSpan.textContent = `[${timestamp}]`;
+            const levelSpan = document.createElement('span');
+            levelSpan.className = `log-level-${level}`;
+            levelSpan.textContent = `[${level.toUpperCase()}]`;
+            logEntry.append(timestampSpan, ' ', levelSpan, ' ' + message);
+            
             logContainer.appendChild(logEntry);
+            if (logContainer.childElementCount > MAX_LOG_ENTRIES) {
+                logContainer.firstElementChild.remove();
+            }
             logContainer.scrollTop = logContainer.scrollHeight;
         }
         
+        // Last value written to each element, so unchanged values cause no DOM write or reflow
+        const lastWritten = {};
+        
+        function setText(id, value) {
+            value = String(value);
+            if (lastWritten[id] === value) return;
+            lastWritten[id] = value;
+            document.getElementById(id).textContent = value;
+        }
+        
+        function setStatus(id, status) {
+            const className = 'status-indicator status-' + status;
+            if (lastWritten[id + '.class'] === className) return;
+            lastWritten[id + '.class'] = className;
+            document.getElementById(id).className = className;
+        }
+        
+        function showHealth(data, responseTime) {
+            setStatus('apiStatus', data.healthy ? 'healthy' : 'unhealthy');
+            setText('apiHealthStatus', data.healthy ? 'Healthy' : 'Unhealthy');
+            setText('apiResponseTime', responseTime === undefined ? '-' : responseTime + 'ms');
+            setText('apiLastCheck', new Date().toLocaleTimeString());
+            
+            if (data.healthy) {
+                addLog('info', 'API health check passed');
+            } else {
+                addLog('warning', 'API health check failed');
+            }
+            
+            return data.healthy;
+        }
+        
         async function checkAPIHealth() {
             const startTime = Date.now();
             try {
                 const response = await fetch('/api/health-check');
                 const data = await response.json();
-                const responseTime = Date.now() - startTime;
-                
-                document.getElementById('apiStatus').className = 'status-indicator ' + 
-                    (data.healthy ? 'status-healthy' : 'status-unhealthy');
-                document.getElementById('apiHealthStatus').textContent = data.healthy ? 'Healthy' : 'Unhealthy';
-                document.getElementById('apiResponseTime').textContent = responseTime + 'ms';
-                document.getElementById('apiLastCheck').textContent = new Date().toLocaleTimeString();
-                
-                if (data.healthy) {
-                    addLog('info', 'API health check passed');
-                } else {
-                    addLog('warning', 'API health check failed');
-                }
-                
-                return data.healthy;
+                return showHealth(data, Date.now() - startTime);
             } catch (error) {
-                document.getElementById('apiStatus').className = 'status-indicator status-unhealthy';
-                document.getElementById('apiHealthStatus').textContent = 'Error';
-                document.getElementById('apiResponseTime').textContent = 'Timeout';
+                setStatus('apiStatus', 'unhealthy');
+                setText('apiHealthStatus', 'Error');
+                setText('apiResponseTime', 'Timeout');
                 addLog('error', 'API health check failed: ' + error.message);
                 return false;
             }
         }
         
-        async function loadWorkflows() {
-            try {
-                const response = await fetch('/api/workflows');
-                const data = await response.json();
-                
-                const workflowList = document.getElementById('workflowList');
-                workflowList.innerHTML = '';
-                
-                data.workflows.forEach(workflow => {
-                    const workflowDiv = document.createElement('div');
-                    workflowDiv.className = 'metric';
-                    workflowDiv.innerHTML = `
-                        <span class="metric-label">${workflow.name}:</span>
-                        <span class="metric-value">${workflow.status}</span>
-                    `;
-                    workflowList.appendChild(workflowDiv);
-                });
-                
-                document.getElementById('workflowStatus').className = 'status-indicator status-healthy';
-                document.getElementById('activeWorkflows').textContent = data.workflows.filter(w => w.status === 'active').length;
-                addLog('info', `Loaded ${data.workflows.length} workflows`);
-            } catch (error) {
-                document.getElementById('workflowStatus').className = 'status-indicator status-unhealthy';
-                addLog('error', 'Failed to load workflows: ' + error.message);
+        // Rendered workflow rows keyed by name, patched in place on each update
+        let workflowRows = null;
+        
+        function showWorkflows(data) {
+            if (data.error) {
+                setStatus('workflowStatus', 'unhealthy');
+                addLog('error', 'Failed to load workflows: ' + data.error);
+                return;
+            }
+            
+            const workflowList = document.getElementById('workflowList');
+            if (workflowRows === null) {
+                workflowList.textContent = '';
+                workflowRows = new Map();
             }
+            
+            const seen = new Set();
+            data.workflows.forEach(workflow => {
+                seen.add(workflow.name);
+                let row = workflowRows.get(workflow.name);
+                if (!row) {
+                    row = document.createElement('div');
+                    row.className = 'metric';
+                    const label = document.createElement('span');
+                    label.className = 'metric-label';
+                    label.textContent = workflow.name + ':';
+                    const value = document.createElement('span');
+                    value.className = 'metric-value';
+                    row.append(label, value);
+                    workflowList.appendChild(row);
+                    workflowRows.set(workflow.name, row);
+                }
+                const value = row.lastElementChild;
+                if (value.textContent !== workflow.status) {
+                    value.textContent = workflow.status;
+                }
+            });
+            for (const [name, row] of workflowRows) {
+                if (!seen.has(name)) {
+                    row.remove();
+                    workflowRows.delete(name);
+                }
+            }
+            
+            setStatus('workflowStatus', 'healthy');
+            setText('activeWorkflows', data.workflows.filter(w => w.status === 'active').length);
+            addLog('info', `Loaded ${data.workflows.length} workflows`);
         }
         
-        async function refreshData() {
+        let updatesReceived = 0;
+        
+        function refreshData(snapshot) {
+            updatesReceived++;
             addLog('info', 'Refreshing dashboard data...');
-            await checkAPIHealth();
-            await loadWorkflows();
+            showHealth(snapshot.health, snapshot.health.response_time_ms);
+            showWorkflows(snapshot.workflows);
             
             // Update system metrics
             const uptime = Math.floor((Date.now() - startTime) / 1000);
-            document.getElementById('systemUptime').textContent = formatUptime(uptime);
-            document.getElementById('totalRequests').textContent = Math.floor(Math.random() * 1000) + 50;
+            setText('systemUptime', formatUptime(uptime));
+            setText('updatesReceived', updatesReceived);
         }
         
         function formatUptime(seconds) {
@@ -373,19 +452,35 @@ DASHBOARD_HTML = """
             return `${hours}h ${minutes}m ${secs}s`;
         }
         
+        function connectStream() {
+            // The server pushes a snapshot every few seconds over one connection
+            stream = new EventSource('/api/stream');
+            stream.onmessage = event => refreshData(JSON.parse(event.data));
+            stream.onerror = () => addLog('warning', 'Live updates interrupted, reconnecting...');
+        }
+        
         function toggleAutoRefresh() {
             autoRefresh = !autoRefresh;
             document.getElementById('autoRefreshStatus').textContent = autoRefresh ? 'ON' : 'OFF';
             
             if (autoRefresh) {
-                refreshInterval = setInterval(refreshData, 5000);
+                connectStream();
                 addLog('info', 'Auto-refresh enabled');
             } else {
-                clearInterval(refreshInterval);
+                stream.close();
                 addLog('info', 'Auto-refresh disabled');
             }
         }
         
+        async function manualRefresh() {
+            try {
+                const response = await fetch('/api/snapshot');
+                refreshData(await response.json());
+            } catch (error) {
+                addLog('error', 'Refresh failed: ' + error.message);
+            }
+        }
+        
         function runHealthCheck() {
             addLog('info', 'Running manual health check...');
             checkAPIHealth();
@@ -412,10 +507,10 @@ DASHBOARD_HTML = """
         
         // Initialize
         const startTime = Date.now();
+        addLog('info', 'OrbitAgents Monitoring Dashboard started');
         
         // Start auto-refresh
-        refreshData();
-        refreshInterval = setInterval(refreshData, 5000);
+        connectStream();
         
         addLog('info', 'Dashboard initialized successfully');
     </script>
@@ -423,45 +518,152 @@ DASHBOARD_HTML = """
 </html>
 """
 
+# The page is static: compress and fingerprint it once so repeat visits
+# revalidate with a 304 instead of downloading it again
+_DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode('utf-8')
+_DASHBOARD_HTML_GZ = gzip.compress(_DASHBOARD_HTML_BYTES, compresslevel=9)
+_DASHBOARD_ETAG = hashlib.md5(_DASHBOARD_HTML_BYTES).hexdigest()
+
+@app.before_serving
+async def open_client():
+    """Open the shared upstream HTTP client and start pushing snapshots"""
+    global _client, _broadcaster
+    _client = httpx.AsyncClient(
+        base_url=API_BASE_URL,
+        timeout=5,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=4)
+    )
+    _broadcaster = asyncio.create_task(_broadcast_snapshots())
+
+@app.after_serving
+async def close_client():
+    """Stop pushing snapshots and close the shared upstream HTTP client"""
+    _broadcaster.cancel()
+    with suppress(asyncio.CancelledError):
+        await _broadcaster
+    await _client.aclose()
+
 @app.route('/')
-def dashboard():
+@cors_exempt
+async def dashboard():
     """Main monitoring dashboard"""
-    return render_template_string(DASHBOARD_HTML, current_time=datetime.now().strftime('%H:%M:%S'))
+    headers = {'Cache-Control': 'public, max-age=3600', 'ETag': f'"{_DASHBOARD_ETAG}"', 'Vary': 'Accept-Encoding'}
+    if _DASHBOARD_ETAG in request.if_none_match:
+        return Response(status=304, headers=headers)
+    if 'gzip' in request.accept_encodings:
+        return Response(_DASHBOARD_HTML_GZ, mimetype='text/html', headers={**headers, 'Content-Encoding': 'gzip'})
+    return Response(_DASHBOARD_HTML_BYTES, mimetype='text/html', headers=headers)
 
-@app.route('/api/health-check')
-def health_check():
-    """Check API health"""
+async def _cached(path, fetch):
+    """Return the cached payload for path, fetching it on a miss"""
+    payload = _cache.get(path)
+    if payload is not None:
+        return payload
+    
+    # Concurrent misses share one upstream call instead of stampeding it
+    task = _inflight.get(path)
+    if task is None:
+        async def load():
+            payload = _cache[path] = await fetch()
+            return payload
+        
+        task = _inflight[path] = asyncio.ensure_future(load())
+        task.add_done_callback(lambda _: _inflight.pop(path, None))
+    # Shielded so a client disconnecting does not cancel the call for the others
+    return await asyncio.shield(task)
+
+async def _fetch_health():
+    """Probe the upstream API health endpoint"""
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
-        return jsonify({
+        response = await _client.get("/health")
+        return {
             'healthy': response.status_code == 200,
             'status_code': response.status_code,
+            'response_time_ms': round(response.elapsed.total_seconds() * 1000),
             'response': response.json() if response.status_code == 200 else None
-        })
+        }
     except Exception as e:
-        return jsonify({
+        return {
             'healthy': False,
             'error': str(e)
-        })
+        }
 
-@app.route('/api/workflows')
-def get_workflows():
-    """Get available workflows"""
+async def _fetch_workflows():
+    """Load the workflow list from the upstream API"""
     try:
-        response = requests.get(f"{API_BASE_URL}/api/browser-agent/workflows", timeout=5)
+        response = await _client.get("/api/browser-agent/workflows")
         return response.json()
     except Exception as e:
-        return jsonify({
+        return {
             'error': str(e),
             'workflows': []
-        })
+        }
+
+@app.route('/api/health-check')
+async def health_check():
+    """Check API health"""
+    return jsonify(await _cached('/api/health-check', _fetch_health))
+
+@app.route('/api/workflows')
+async def get_workflows():
+    """Get available workflows"""
+    return jsonify(await _cached('/api/workflows', _fetch_workflows))
+
+async def _snapshot():
+    """Everything the dashboard refreshes on each tick, in one payload"""
+    health, workflows = await asyncio.gather(
+        _cached('/api/health-check', _fetch_health),
+        _cached('/api/workflows', _fetch_workflows)
+    )
+    return {'health': health, 'workflows': workflows}
+
+async def _broadcast_snapshots():
+    """Fetch one snapshot per interval and push it to every open stream"""
+    while True:
+        await asyncio.sleep(STREAM_INTERVAL)
+        if not _subscribers:
+            continue
+        
+        event = f"data: {json.dumps(await _snapshot())}\n\n"
+        for queue in _subscribers:
+            # Slow clients only ever need the newest snapshot
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+@app.route('/api/snapshot')
+async def snapshot():
+    """Health and workflows together, fetched from the upstream concurrently"""
+    return jsonify(await _snapshot())
+
+@app.route('/api/stream')
+async def stream():
+    """Server-sent stream of dashboard snapshots"""
+    queue = asyncio.Queue(maxsize=1)
+    
+    async def events():
+        _subscribers.add(queue)
+        try:
+            yield f"data: {json.dumps(await _snapshot())}\n\n"
+            while True:
+                yield await queue.get()
+        finally:
+            _subscribers.discard(queue)
+    
+    response = await make_response(events(), {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache'
+    })
+    response.timeout = None
+    return response
 
 @app.route('/api/execute-test-workflow', methods=['POST'])
-def execute_test_workflow():
+async def execute_test_workflow():
     """Execute a test workflow"""
+    _cache.pop('/api/workflows', None)
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/browser-agent/execute",
+        response = await _client.post(
+            "/api/browser-agent/execute",
             json={'workflow_id': 1, 'parameters': {'test': True}},
             timeout=10
         )
@@ -477,8 +679,13 @@ if __name__ == '__main__':
     print("📊 Dashboard will be available at: http://localhost:9090")
     print("🔗 Monitoring OrbitAgents API at: http://localhost:8080")
     
-    app.run(
-        host='0.0.0.0',
-        port=9090,
-        debug=True
-    )
+    if os.getenv("ORBIT_DEV"):
+        # Reloader and debugger for local development only
+        app.run(host='0.0.0.0', port=9090, debug=True)
+    else:
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+        
+        config = Config()
+        config.bind = ['0.0.0.0:9090']
+        asyncio.run(serve(app, config))
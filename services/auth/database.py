@@ -10,12 +10,23 @@ import os
 
 from config import settings
 
+# Pool sizing only applies to server databases; SQLite picks its own pool.
+# Each worker process builds its own engine, so the workers split
+# DB_MAX_CONNECTIONS evenly and a pool never grows past its share
+worker_share = max(1, settings.DB_MAX_CONNECTIONS // settings.worker_count)
+pool_size = min(settings.DB_POOL_SIZE, worker_share)
+pool_options = {} if settings.DATABASE_URL.startswith("sqlite") else {
+    "pool_size": pool_size,
+    "max_overflow": min(settings.DB_MAX_OVERFLOW, worker_share - pool_size),
+}
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before use
     pool_recycle=300,    # Recycle connections every 5 minutes
-    echo=settings.DEBUG   # Log SQL queries in debug mode
+    echo=settings.DEBUG,  # Log SQL queries in debug mode
+    **pool_options
 )
 
 # Create SessionLocal class
@@ -8,23 +8,39 @@ from fastapi import FastAPI, HTTPException, Depends, status, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.routing import Match, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import Select, bindparam, select, text
 from sqlalchemy.exc import IntegrityError, DatabaseError
 import uvicorn
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
 import os
 import re
 import logging
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
-from passlib.context import CryptContext
+import bcrypt
+import orjson
+from cachetools import TLRUCache
 from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client.metrics import MetricWrapperBase
 from fastapi.responses import Response
 import time
-from typing import Optional
+from typing import (
+    Any, AsyncIterator, Dict, Hashable, Iterable, Optional, Tuple
+)
 from pydantic import ValidationError
 import secrets
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, suppress
+from concurrent.futures import ThreadPoolExecutor
 
 from database import get_db, engine
 from models import User, Base
@@ -35,21 +51,43 @@ from config import settings
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create tables
-try:
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created successfully")
-except Exception as e:
-    logger.error(f"Failed to create database tables: {e}")
-    raise
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create tables at startup rather than import, unless migrations own the
+    schema, and keep the /healthz database probe fresh in the background."""
+    if settings.AUTO_CREATE_SCHEMA:
+        try:
+            await asyncio.to_thread(Base.metadata.create_all, bind=engine)
+            logger.info("Database tables created successfully")
+        except Exception as e:
+            logger.error(f"Failed to create database tables: {e}")
+            raise
+
+    # Bind each route's success-status request counter before traffic arrives
+    for route in app.routes:
+        if isinstance(route, Route):
+            for method in route.methods or ():
+                status_code = getattr(route, "status_code", None) or 200
+                _REQUEST_COUNTS[method, route.path, status_code]
+    health_probe = asyncio.create_task(_probe_database_health())
+    yield
+
+    health_probe.cancel()
+    with suppress(asyncio.CancelledError):
+        await health_probe
+    if _redis is not None:
+        await _redis.aclose()
 
 # Initialize FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     title="OrbitAgents Auth Service",
     description="Authentication and authorization service for OrbitAgents platform",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Security middleware - Skip trusted host middleware for testing
@@ -61,7 +99,7 @@ app = FastAPI(
 
 # CORS middleware
 try:
-    allowed_origins = settings.ALLOWED_ORIGINS.split(",")
+    allowed_origins = settings.allowed_origins
     app.add_middleware(
         CORSMiddleware,
         allow_origins=allowed_origins,
@@ -70,33 +108,155 @@ try:
         allow_headers=["*"],
         max_age=3600,  # Cache preflight requests for 1 hour
     )
-    logger.info(f"CORS configured with origins: {allowed_origins}")
+    logger.info(f"CORS configured with origins: {sorted(allowed_origins)}")
 except Exception as e:
     logger.error(f"Failed to configure CORS: {e}")
     raise
 
-# Password hashing with stronger configuration
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12  # Increased rounds for better security
-)
-
 # JWT Security
 security = HTTPBearer(auto_error=False)  # Don't auto-error to handle custom responses
 
+# Settings read on every token or password operation, bound once
+JWT_SECRET = settings.jwt_secret_bytes
+JWT_ALGORITHM = settings.JWT_ALGORITHM
+JWT_ALGORITHMS = [JWT_ALGORITHM]
+JWT_LIFETIME = timedelta(minutes=settings.JWT_EXPIRATION_MINUTES)
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
+
+# User-by-email lookup shared by login and get_current_user; built once so each
+# call reuses SQLAlchemy's cached compilation instead of rebuilding a Query
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+# Registration only needs to know whether the email is taken, not the whole row
+_USER_ID_BY_EMAIL: Select[int] = select(User.id).where(
+    User.email == bindparam("email")
+)
+
+# Verified tokens -> (user, exp); entries live TOKEN_CACHE_TTL seconds or until
+# the token expires
+TOKEN_CACHE_TTL = 60
+_TOKEN_CACHE: TLRUCache[str, Tuple[User, int]] = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _token, entry, now: min(now + TOKEN_CACHE_TTL, entry[1]),
+    timer=time.time,
+)
+
+# Optional Redis tier shared by every worker process; without REDIS_URL the
+# token cache stays in-process only
+if settings.REDIS_URL:
+    import redis.asyncio as redis_asyncio
+    _redis = redis_asyncio.from_url(settings.REDIS_URL, socket_timeout=0.25)
+else:
+    _redis = None
+REDIS_TOKEN_TTL_CAP = 300
+
+
+def _redis_token_key(token: str) -> str:
+    """Redis key for a token; the raw token itself is never stored."""
+    return "auth:token:" + hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+async def _load_shared_token(token: str) -> Optional[Tuple[User, int]]:
+    """Return (user, exp) for a token verified by any worker, or None."""
+    if _redis is None:
+        return None
+    key = _redis_token_key(token)
+    try:
+        raw = await _redis.get(key)
+    except Exception as e:
+        logger.warning(f"Token cache read failed: {e}")
+        return None
+    if raw is None:
+        return None
+
+    try:
+        data = orjson.loads(raw)
+        user = User(
+            id=data["id"],
+            email=data["email"],
+            is_active=data["is_active"],
+            created_at=(
+                datetime.fromisoformat(data["created_at"])
+                if data["created_at"] else None
+            ),
+        )
+        return user, data["exp"]
+    except Exception as e:
+        # Corrupt or older-format entry: drop it and verify via JWT and DB
+        logger.warning(f"Discarding unreadable token cache entry: {e}")
+        try:
+            await _redis.delete(key)
+        except Exception:
+            pass
+        return None
+
+
+async def _store_shared_token(token: str, user: User, exp: int) -> None:
+    """Share a verified token with other workers until it expires.
+
+    The Redis TTL is capped at REDIS_TOKEN_TTL_CAP.
+    """
+    if _redis is None:
+        return
+    ttl = min(REDIS_TOKEN_TTL_CAP, int(exp - time.time()))
+    if ttl <= 0:
+        return
+    entry = {
+        "id": user.id,
+        "email": user.email,
+        "is_active": user.is_active,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "exp": exp
+    }
+    try:
+        await _redis.setex(_redis_token_key(token), ttl, orjson.dumps(entry))
+    except Exception as e:
+        logger.warning(f"Token cache write failed: {e}")
+
 # Prometheus metrics
 REQUEST_COUNT = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
 REQUEST_DURATION = Histogram('http_request_duration_seconds', 'HTTP request duration')
 LOGIN_ATTEMPTS = Counter('auth_login_attempts_total', 'Total login attempts', ['status'])
 REGISTRATION_ATTEMPTS = Counter('auth_registration_attempts_total', 'Total registration attempts', ['status'])
 
+
+class _LabelChildren(Dict[Hashable, Any]):
+    """Labelled children of one metric, keyed by label values, bound on use."""
+
+    def __init__(
+        self, metric: MetricWrapperBase, known: Iterable[Hashable] = ()
+    ) -> None:
+        super().__init__()
+        self.metric = metric
+        for key in known:
+            self[key]
+
+    def __missing__(self, key: Hashable) -> Any:
+        values = key if isinstance(key, tuple) else (key,)
+        child = self[key] = self.metric.labels(*values)
+        return child
+
+
+# Request counters are keyed (method, route template, status); route successes
+# are bound at startup
+_REQUEST_COUNTS = _LabelChildren(REQUEST_COUNT)
+_observe_request_duration = REQUEST_DURATION.observe
+UNMATCHED_ENDPOINT = "<unmatched>"
+_LOGIN_ATTEMPTS = _LabelChildren(
+    LOGIN_ATTEMPTS, ("success", "failed", "inactive", "rate_limited", "error")
+)
+_REGISTRATION_ATTEMPTS = _LabelChildren(
+    REGISTRATION_ATTEMPTS,
+    ("success", "duplicate_email", "invalid_email", "rate_limited", "error"),
+)
+
 # Check if we're in testing mode
 IS_TESTING = os.getenv("TESTING", "false").lower() == "true" or "pytest" in os.environ.get("_", "")
 
-# Rate limiting storage (in production, use Redis)
-from collections import defaultdict, deque
-rate_limit_storage = defaultdict(lambda: deque())
+# Rate limiting storage (in production, use Redis): identifier -> ring of the
+# last max_requests allowed request times, least recently used identifiers
+# evicted first
+RATE_LIMIT_MAX_KEYS = 100_000
+rate_limit_storage: "OrderedDict[str, deque]" = OrderedDict()
 
 def is_rate_limited(identifier: str, max_requests: int = 10, window_seconds: int = 300) -> bool:
     """
@@ -114,77 +274,137 @@ def is_rate_limited(identifier: str, max_requests: int = 10, window_seconds: int
     if IS_TESTING:
         return False
         
-    current_time = time.time()
-    requests = rate_limit_storage[identifier]
-    
-    # Remove old requests outside the window
-    while requests and requests[0] <= current_time - window_seconds:
-        requests.popleft()
+    current_time = time.monotonic()
+    requests = rate_limit_storage.get(identifier)
+    if requests is None:
+        requests = rate_limit_storage[identifier] = deque(maxlen=max_requests)
+        if len(rate_limit_storage) > RATE_LIMIT_MAX_KEYS:
+            rate_limit_storage.popitem(last=False)
+    else:
+        rate_limit_storage.move_to_end(identifier)
     
-    # Check if rate limited
-    if len(requests) >= max_requests:
-        logger.warning(f"Rate limit exceeded for {identifier}: {len(requests)}/{max_requests} requests")
+    # Rate limited when the oldest of the last max_requests requests is still
+    # in the window
+    window_start = current_time - window_seconds
+    if len(requests) == requests.maxlen and requests[0] > window_start:
+        logger.warning(
+            f"Rate limit exceeded for {identifier}: "
+            f"{max_requests}/{max_requests} requests"
+        )
         return True
     
-    # Add current request
+    # Add current request; the ring drops the oldest once full
     requests.append(current_time)
     return False
 
+
+# Basic RFC 5322 pattern; the local part is capped at the RFC 5321 limit of 64
+_EMAIL_RE = re.compile(
+    r'^[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+)
+
 def validate_email_format(email: str) -> bool:
     """Enhanced email validation."""
     if not email or len(email) > 254:  # RFC 5321 limit
         return False
     
-    # Basic RFC 5322 regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
-        return False
-    
-    # Additional checks
-    local, domain = email.split('@')
-    if len(local) > 64:  # RFC 5321 limit for local part
-        return False
-    
-    return True
+    return _EMAIL_RE.match(email) is not None
+
+
+def _password_bytes(password: str) -> bytes:
+    """Encode a password for bcrypt, which only uses the first 72 bytes."""
+    return password.encode("utf-8")[:72]
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt with enhanced security."""
     if not password:
         raise ValueError("Password cannot be empty")
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(_password_bytes(password), salt).decode("ascii")
+
+
+# Hash checked when there is no real one, so failed lookups cost as much as
+# real verifies; hashed at import so it uses the configured BCRYPT_ROUNDS
+DUMMY_PASSWORD_HASH = hash_password("not-a-real-password")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash with timing attack protection."""
     if not plain_password or not hashed_password:
         # Use a dummy hash to maintain constant time
-        pwd_context.verify("dummy", "$2b$12$QoB1Icxal9ERFSzRFXGtDuKxW5Y6iavpsAw21T9BhauXmpr.65je2")
+        bcrypt.checkpw(b"dummy", DUMMY_PASSWORD_HASH.encode("ascii"))
         return False
     
     try:
-        return pwd_context.verify(plain_password, hashed_password)
+        return bcrypt.checkpw(
+            _password_bytes(plain_password), hashed_password.encode("ascii")
+        )
     except Exception as e:
         logger.warning(f"Password verification error: {e}")
         return False
 
+
+# Dedicated pool for bcrypt, which releases the GIL; keeps KDF work off the
+# event loop without crowding the default executor that runs DB calls. bcrypt
+# is pure CPU, so one thread per core is all that can run at once
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt"
+)
+
+
+async def ahash_password(password: str) -> str:
+    """Hash a password on the bcrypt pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _BCRYPT_POOL, hash_password, password
+    )
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the bcrypt pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _BCRYPT_POOL, verify_password, plain_password, hashed_password
+    )
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWS requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# HS256 tokens share one header and key, so encode both just once
+_JWT_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+_JWT_HMAC = hmac.new(JWT_SECRET, digestmod=hashlib.sha256)
+
+
+def _encode_hs256(claims: dict) -> str:
+    """Sign claims as an HS256 JWT with the precomputed header and HMAC key."""
+    payload = json.dumps(claims, separators=(",", ":")).encode("utf-8")
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(payload)
+    mac = _JWT_HMAC.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token with enhanced security."""
     to_encode = data.copy()
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRATION_MINUTES)
+    now = int(time.time())
+    lifetime = expires_delta or JWT_LIFETIME
     
     # Add standard JWT claims
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + int(lifetime.total_seconds()),
+        "iat": now,
         "iss": "orbitagents-auth",  # Issuer
         "aud": "orbitagents-platform"  # Audience
     })
     
     try:
-        encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+        if JWT_ALGORITHM == "HS256":
+            return _encode_hs256(to_encode)
+        encoded_jwt = jwt.encode(
+            to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM
+        )
         return encoded_jwt
     except Exception as e:
         logger.error(f"JWT encoding error: {e}")
@@ -193,7 +413,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
             detail="Failed to generate access token"
         )
 
-def get_current_user(
+
+async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security), 
     db: Session = Depends(get_db)
 ) -> User:
@@ -211,12 +432,29 @@ def get_current_user(
             detail="Invalid authorization header format"
         )
     
+    cached = _TOKEN_CACHE.get(credentials.credentials)
+    if cached is not None:
+        return cached[0]
+
+    # Reject anything without the three JWS segments before Redis, base64 or
+    # HMAC work
+    if credentials.credentials.count(".") != 2:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token"
+        )
+
+    shared = await _load_shared_token(credentials.credentials)
+    if shared is not None:
+        _TOKEN_CACHE[credentials.credentials] = shared
+        return shared[0]
+
     try:
         # Decode and validate JWT
         payload = jwt.decode(
             credentials.credentials,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
+            JWT_SECRET,
+            algorithms=JWT_ALGORITHMS,
             audience="orbitagents-platform",
             issuer="orbitagents-auth"
         )
@@ -255,7 +493,11 @@ def get_current_user(
     
     # Get user from database
     try:
-        user = db.query(User).filter(User.email == email).first()
+        user = await asyncio.to_thread(
+            lambda: db.execute(
+                _USER_BY_EMAIL, {"email": email}
+            ).scalar_one_or_none()
+        )
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -268,6 +510,10 @@ def get_current_user(
                 detail="User account is inactive"
             )
         
+        _TOKEN_CACHE[credentials.credentials] = (user, payload["exp"])
+        await _store_shared_token(
+            credentials.credentials, user, payload["exp"]
+        )
         return user
         
     except HTTPException:
@@ -282,7 +528,7 @@ def get_current_user(
 @app.exception_handler(ValidationError)
 async def validation_exception_handler(request: Request, exc: ValidationError):
     """Handle Pydantic validation errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Input validation failed",
@@ -293,7 +539,7 @@ async def validation_exception_handler(request: Request, exc: ValidationError):
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
     """Handle value errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={"detail": str(exc)}
     )
@@ -302,66 +548,125 @@ async def value_error_handler(request: Request, exc: ValueError):
 async def database_error_handler(request: Request, exc: DatabaseError):
     """Handle database errors."""
     logger.error(f"Database error: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         content={"detail": "Database service temporarily unavailable"}
     )
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Add request metrics and timing with enhanced security logging."""
-    start_time = time.time()
+
+def _route_template(scope: Scope) -> str:
+    """Path template of the route that served a request, else UNMATCHED."""
+    route = scope.get("route")
+    if route is None:
+        # Only APIRoute records itself in the scope; docs and other plain
+        # Starlette routes are found by matching the router again
+        route = next(
+            (
+                r for r in app.router.routes
+                if r.matches(scope)[0] != Match.NONE
+            ),
+            None,
+        )
+    return getattr(route, "path", UNMATCHED_ENDPOINT)
+
+
+class RequestMetricsMiddleware:
+    """Record request metrics and timing with enhanced security logging.
     
-    # Log security-relevant information
-    client_ip = request.client.host if request.client else "unknown"
-    user_agent = request.headers.get("user-agent", "unknown")
+    Plain ASGI middleware rather than ``@app.middleware("http")``, which runs
+    every request through BaseHTTPMiddleware's extra task and body streaming.
+    """
     
-    try:
-        response = await call_next(request)
-        process_time = time.time() - start_time
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(
+                    "X-Process-Time", f"{time.perf_counter() - start_time:.6f}"
+                )
+            await send(message)
         
-        # Record metrics
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=response.status_code
-        ).inc()
-        REQUEST_DURATION.observe(process_time)
+        method = scope["method"]
+        path = scope["path"]
+        client_ip = scope["client"][0] if scope.get("client") else "unknown"
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        except Exception as e:
+            logger.error(
+                f"Request error: {method} {path} "
+                f"Error: {e} IP: {client_ip}"
+            )
+            raise
+        finally:
+            # Record metrics
+            # Label by route template so unmatched or parameterised paths can't
+            # grow the series
+            _REQUEST_COUNTS[method, _route_template(scope), status_code].inc()
+            _observe_request_duration(time.perf_counter() - start_time)
         
         # Log suspicious activity
-        if response.status_code >= 400:
+        if status_code >= 400:
+            user_agent = Headers(scope=scope).get("user-agent", "unknown")
             logger.warning(
-                f"Failed request: {request.method} {request.url.path} "
-                f"Status: {response.status_code} IP: {client_ip} "
+                f"Failed request: {method} {path} "
+                f"Status: {status_code} IP: {client_ip} "
                 f"User-Agent: {user_agent}"
             )
-        
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
-        
-    except Exception as e:
-        process_time = time.time() - start_time
-        logger.error(
-            f"Request error: {request.method} {request.url.path} "
-            f"Error: {e} IP: {client_ip}"
-        )
-        
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=500
-        ).inc()
-        REQUEST_DURATION.observe(process_time)
-        
-        raise
+
+
+app.add_middleware(RequestMetricsMiddleware)
+
+# A successful DB probe is trusted for this long before /healthz checks again;
+# the background probe refreshes it every HEALTH_PROBE_INTERVAL so requests
+# rarely have to
+HEALTH_CACHE_SECONDS = 15
+HEALTH_PROBE_INTERVAL = 5
+_HEALTH_CACHE: Dict[str, float] = {"ok_until": 0.0}
+
+
+def _select_one() -> None:
+    """Run SELECT 1 on a pooled connection."""
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1")).fetchone()
+
+
+async def _probe_database_health() -> None:
+    """Refresh the /healthz cache with a real database probe on an interval."""
+    while True:
+        try:
+            await asyncio.to_thread(_select_one)
+            _HEALTH_CACHE["ok_until"] = time.monotonic() + HEALTH_CACHE_SECONDS
+        except Exception as e:
+            # Drop the cached result so the next /healthz probes for itself
+            _HEALTH_CACHE["ok_until"] = 0.0
+            logger.warning(f"Background database probe failed: {e}")
+        await asyncio.sleep(HEALTH_PROBE_INTERVAL)
 
 @app.get("/healthz")
 async def health_check(db: Session = Depends(get_db)):
     """Health check endpoint for Kubernetes probes with enhanced validation."""
     try:
-        # Test database connection with timeout
-        result = db.execute(text("SELECT 1"))
-        result.fetchone()
+        now = time.monotonic()
+        if now >= _HEALTH_CACHE["ok_until"]:
+            # Test database connection with timeout
+            await asyncio.to_thread(
+                lambda: db.execute(text("SELECT 1")).fetchone()
+            )
+            _HEALTH_CACHE["ok_until"] = now + HEALTH_CACHE_SECONDS
         
         return {
             "status": "healthy",
@@ -377,11 +682,19 @@ async def health_check(db: Session = Depends(get_db)):
             detail=f"Service unhealthy: Database connection failed"
         )
 
+# Overlapping scrapes within this window share one serialised registry snapshot
+METRICS_CACHE_SECONDS = 2
+_METRICS_CACHE: Dict[str, Any] = {"expires": 0.0, "body": b""}
+
 @app.get("/metrics")
 async def metrics():
     """Prometheus metrics endpoint."""
     try:
-        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+        now = time.monotonic()
+        if now >= _METRICS_CACHE["expires"]:
+            _METRICS_CACHE["body"] = generate_latest()
+            _METRICS_CACHE["expires"] = now + METRICS_CACHE_SECONDS
+        return Response(_METRICS_CACHE["body"], media_type=CONTENT_TYPE_LATEST)
     except Exception as e:
         logger.error(f"Metrics generation failed: {e}")
         raise HTTPException(
@@ -389,6 +702,16 @@ async def metrics():
             detail="Metrics service error"
         )
 
+
+def _user_response_body(user: User) -> dict:
+    """UserResponse fields for a user row, without re-validating it."""
+    return {
+        "id": user.id,
+        "email": user.email,
+        "is_active": user.is_active,
+        "created_at": user.created_at
+    }
+
 @app.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(user_data: UserCreate, request: Request, db: Session = Depends(get_db)):
     """Register a new user with enhanced security and validation."""
@@ -396,7 +719,7 @@ async def register(user_data: UserCreate, request: Request, db: Session = Depend
     # Rate limiting
     client_ip = request.client.host if request.client else "unknown"
     if is_rate_limited(f"register_{client_ip}", max_requests=5, window_seconds=300):
-        REGISTRATION_ATTEMPTS.labels(status="rate_limited").inc()
+        _REGISTRATION_ATTEMPTS["rate_limited"].inc()
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Too many registration attempts. Please try again later."
@@ -404,44 +727,48 @@ async def register(user_data: UserCreate, request: Request, db: Session = Depend
     
     # Additional email validation
     if not validate_email_format(user_data.email):
-        REGISTRATION_ATTEMPTS.labels(status="invalid_email").inc()
+        _REGISTRATION_ATTEMPTS["invalid_email"].inc()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email format"
         )
     
-    # Normalize email
-    normalized_email = user_data.email.lower().strip()
+    # Email is already stripped and lower-cased by the schema validator
+    normalized_email = user_data.email
     
     try:
         # Check if user already exists
-        existing_user = db.query(User).filter(User.email == normalized_email).first()
-        if existing_user:
-            REGISTRATION_ATTEMPTS.labels(status="duplicate_email").inc()
+        existing_user_id = await asyncio.to_thread(
+            lambda: db.execute(
+                _USER_ID_BY_EMAIL, {"email": normalized_email}
+            ).scalar_one_or_none()
+        )
+        if existing_user_id is not None:
+            _REGISTRATION_ATTEMPTS["duplicate_email"].inc()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
         
         # Create new user
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await ahash_password(user_data.password)
         db_user = User(
             email=normalized_email,
             hashed_password=hashed_password
         )
         
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        def save_user():
+            db.add(db_user)
+            db.commit()
+            db.refresh(db_user)
+
+        await asyncio.to_thread(save_user)
         
-        REGISTRATION_ATTEMPTS.labels(status="success").inc()
+        _REGISTRATION_ATTEMPTS["success"].inc()
         logger.info(f"User registered successfully: {normalized_email}")
         
-        return UserResponse(
-            id=db_user.id,
-            email=db_user.email,
-            created_at=db_user.created_at,
-            is_active=db_user.is_active
+        return ORJSONResponse(
+            _user_response_body(db_user), status_code=status.HTTP_201_CREATED
         )
         
     except HTTPException:
@@ -450,7 +777,7 @@ async def register(user_data: UserCreate, request: Request, db: Session = Depend
     except IntegrityError as e:
         db.rollback()
         logger.warning(f"Registration integrity error: {e}")
-        REGISTRATION_ATTEMPTS.labels(status="duplicate_email").inc()
+        _REGISTRATION_ATTEMPTS["duplicate_email"].inc()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
@@ -458,7 +785,7 @@ async def register(user_data: UserCreate, request: Request, db: Session = Depend
     except Exception as e:
         db.rollback()
         logger.error(f"Registration error: {e}")
-        REGISTRATION_ATTEMPTS.labels(status="error").inc()
+        _REGISTRATION_ATTEMPTS["error"].inc()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Registration service temporarily unavailable"
@@ -471,29 +798,32 @@ async def login(user_credentials: UserLogin, request: Request, db: Session = Dep
     # Rate limiting
     client_ip = request.client.host if request.client else "unknown"
     if is_rate_limited(f"login_{client_ip}", max_requests=10, window_seconds=300):
-        LOGIN_ATTEMPTS.labels(status="rate_limited").inc()
+        _LOGIN_ATTEMPTS["rate_limited"].inc()
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Too many login attempts. Please try again later."
         )
     
-    # Normalize email
-    normalized_email = user_credentials.email.lower().strip()
+    # Email is already stripped and lower-cased by the schema validator
+    normalized_email = user_credentials.email
     
     try:
-        # Find user
-        user = db.query(User).filter(User.email == normalized_email).first()
+        # Find user and verify password in worker threads so neither the DB
+        # round-trip nor bcrypt blocks the event loop for other requests
+        user = await asyncio.to_thread(
+            lambda: db.execute(
+                _USER_BY_EMAIL, {"email": normalized_email}
+            ).scalar_one_or_none()
+        )
         
         # Verify password (always takes same time whether user exists or not)
-        password_valid = False
-        if user:
-            password_valid = verify_password(user_credentials.password, user.hashed_password)
-        else:
-            # Perform dummy password verification to prevent timing attacks
-            verify_password("dummy_password", "$2b$12$QoB1Icxal9ERFSzRFXGtDuKxW5Y6iavpsAw21T9BhauXmpr.65je2")
+        password_valid = await averify_password(
+            user_credentials.password,
+            user.hashed_password if user else DUMMY_PASSWORD_HASH,
+        )
         
         if not user or not password_valid:
-            LOGIN_ATTEMPTS.labels(status="failed").inc()
+            _LOGIN_ATTEMPTS["failed"].inc()
             logger.warning(f"Failed login attempt for: {normalized_email} from IP: {client_ip}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -501,7 +831,7 @@ async def login(user_credentials: UserLogin, request: Request, db: Session = Dep
             )
         
         if not user.is_active:
-            LOGIN_ATTEMPTS.labels(status="inactive").inc()
+            _LOGIN_ATTEMPTS["inactive"].inc()
             logger.warning(f"Login attempt for inactive user: {normalized_email}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -509,26 +839,25 @@ async def login(user_credentials: UserLogin, request: Request, db: Session = Dep
             )
         
         # Create access token
-        access_token_expires = timedelta(minutes=settings.JWT_EXPIRATION_MINUTES)
         access_token = create_access_token(
             data={"sub": user.email}, 
-            expires_delta=access_token_expires
+            expires_delta=JWT_LIFETIME
         )
         
-        LOGIN_ATTEMPTS.labels(status="success").inc()
+        _LOGIN_ATTEMPTS["success"].inc()
         logger.info(f"Successful login: {normalized_email}")
         
         return Token(
             access_token=access_token,
             token_type="bearer",
-            expires_in=settings.JWT_EXPIRATION_MINUTES * 60  # Convert to seconds
+            expires_in=int(JWT_LIFETIME.total_seconds())
         )
         
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Login error: {e}")
-        LOGIN_ATTEMPTS.labels(status="error").inc()
+        _LOGIN_ATTEMPTS["error"].inc()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Authentication service temporarily unavailable"
@@ -538,12 +867,7 @@ async def login(user_credentials: UserLogin, request: Request, db: Session = Dep
 async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information with enhanced validation."""
     try:
-        return UserResponse(
-            id=current_user.id,
-            email=current_user.email,
-            created_at=current_user.created_at,
-            is_active=current_user.is_active
-        )
+        return ORJSONResponse(_user_response_body(current_user))
     except Exception as e:
         logger.error(f"Get user info error: {e}")
         raise HTTPException(
@@ -552,10 +876,15 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
         )
 
 if __name__ == "__main__":
+    # uvloop/httptools come with uvicorn[standard]; reload and multiple workers
+    # are mutually exclusive, so DEBUG runs a single reloading process
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        access_log=True
-    ) 
\ No newline at end of file
+        loop="uvloop",
+        http="httptools",
+        workers=settings.worker_count,
+        reload=settings.DEBUG,
+        access_log=settings.DEBUG
+    )
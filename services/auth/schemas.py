@@ -11,6 +11,24 @@ import os
 # Check if we're in testing mode
 IS_TESTING = os.getenv("TESTING", "false").lower() == "true" or "pytest" in os.environ.get("_", "")
 
+# Validation patterns, compiled once and combined so each check is a single scan
+_SUSPICIOUS_EMAIL_RE = re.compile(
+    r'\.{2,}'  # Multiple consecutive dots
+    r'|^\.|\.$'  # Leading or trailing dots
+    r'|[<>"\'\\\[\]]'  # Potentially dangerous characters
+)
+_WEAK_PASSWORD_RE = re.compile(
+    r'(.)\1{3,}'  # 4+ repeated characters
+    r'|1234|abcd|qwerty|password'  # Common weak sequences
+    r'|^\d+$'  # Only numbers
+    r'|^[a-zA-Z]+$'  # Only letters
+)
+_JWT_PART_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+# Character-class bits collected by UserCreate.validate_password
+_HAS_UPPER, _HAS_LOWER, _HAS_DIGIT = 1, 2, 4
+_HAS_ALL_CLASSES = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT
+
 
 class UserCreate(BaseModel):
     """Schema for user registration with comprehensive validation."""
@@ -46,15 +64,8 @@ class UserCreate(BaseModel):
             raise ValueError('Email local part is too long')
         
         # Check for suspicious patterns
-        suspicious_patterns = [
-            r'\.{2,}',  # Multiple consecutive dots
-            r'^\.|\.$',  # Leading or trailing dots
-            r'[<>"\'\\\[\]]',  # Potentially dangerous characters
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, v):
-                raise ValueError('Email contains invalid characters or patterns')
+        if _SUSPICIOUS_EMAIL_RE.search(v):
+            raise ValueError('Email contains invalid characters or patterns')
         
         return v
     
@@ -76,29 +87,28 @@ class UserCreate(BaseModel):
             # Only check basic requirements for testing
             return v
         
-        # Check for required character types
-        has_upper = any(c.isupper() for c in v)
-        has_lower = any(c.islower() for c in v)
-        has_digit = any(c.isdigit() for c in v)
+        # Check for required character types in one pass, stopping once all are seen
+        classes = 0
+        for c in v:
+            if c.isupper():
+                classes |= _HAS_UPPER
+            elif c.islower():
+                classes |= _HAS_LOWER
+            elif c.isdigit():
+                classes |= _HAS_DIGIT
+            if classes == _HAS_ALL_CLASSES:
+                break
         
-        if not has_upper:
+        if not classes & _HAS_UPPER:
             raise ValueError('Password must contain at least one uppercase letter')
-        if not has_lower:
+        if not classes & _HAS_LOWER:
             raise ValueError('Password must contain at least one lowercase letter')
-        if not has_digit:
+        if not classes & _HAS_DIGIT:
             raise ValueError('Password must contain at least one digit')
         
         # Check for common weak patterns
-        weak_patterns = [
-            r'(.)\1{3,}',  # 4+ repeated characters
-            r'1234|abcd|qwerty|password',  # Common weak sequences
-            r'^\d+$',  # Only numbers
-            r'^[a-zA-Z]+$',  # Only letters
-        ]
-        
-        for pattern in weak_patterns:
-            if re.search(pattern, v.lower()):
-                raise ValueError('Password contains weak patterns')
+        if _WEAK_PASSWORD_RE.search(v.lower()):
+            raise ValueError('Password contains weak patterns')
         
         # Check for whitespace (not typically allowed)
         if v.strip() != v:
@@ -218,7 +228,7 @@ class Token(BaseModel):
         
         # Check each part is base64-like
         for part in parts:
-            if not re.match(r'^[A-Za-z0-9_-]+$', part):
+            if not _JWT_PART_RE.match(part):
                 raise ValueError('Invalid JWT token encoding')
         
         return v
@@ -11,8 +11,10 @@ from sqlalchemy.pool import StaticPool
 
 # Set testing environment before importing app modules
 os.environ["TESTING"] = "true"
+# Minimum bcrypt cost keeps the many register/login calls in the suite fast
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
 
-from main import app
+from main import app, _TOKEN_CACHE
 from database import get_db, Base
 from config import settings
 
@@ -49,6 +51,7 @@ def db_session():
     
     Base.metadata.drop_all(bind=engine)
     app.dependency_overrides.clear()
+    _TOKEN_CACHE.clear()
 
 
 @pytest.fixture(scope="function")
@@ -2,12 +2,68 @@
 Unit tests for Auth service endpoints.
 """
 
+import time
+
 import pytest
 from fastapi import status
+from fastapi.testclient import TestClient
 from jose import jwt
 from datetime import datetime, timedelta
 
+import main
 from config import settings
+from database import get_db
+
+
+class FakeRedis:
+    """In-memory stand-in for the shared token tier.
+
+    It can hold one raw value for every key, or fail on every call.
+    """
+
+    def __init__(self, raw=None, fail=False):
+        self.raw = raw
+        self.fail = fail
+        self.deleted = []
+        self.stored = {}
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.raw
+
+    async def setex(self, key, ttl, value):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.stored[key] = value
+
+    async def delete(self, key):
+        self.deleted.append(key)
+
+    async def aclose(self):
+        pass
+
+
+class BrokenSession:
+    """Database session whose every query fails."""
+
+    def execute(self, *args, **kwargs):
+        raise ConnectionError("database down")
+
+    def close(self):
+        pass
+
+
+def override_broken_db():
+    """Override database dependency with a session that cannot connect."""
+    yield BrokenSession()
+
+
+def register_and_login(client, user_data):
+    """Register a user and return an Authorization header for them."""
+    client.post("/register", json=user_data)
+    response = client.post("/login", json=user_data)
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
 
 
 class TestHealthCheck:
@@ -23,6 +79,33 @@ class TestHealthCheck:
         assert data["version"] == "1.0.0"
         assert "timestamp" in data
 
+    def test_health_check_cached_then_fallback(self, db_session, monkeypatch):
+        """Test /healthz trusts a fresh probe, then queries once it lapses."""
+        async def no_probe():
+            pass
+
+        monkeypatch.setattr(main, "_probe_database_health", no_probe)
+        monkeypatch.setitem(main._HEALTH_CACHE, "ok_until", 0.0)
+        working_db = main.app.dependency_overrides[get_db]
+
+        with TestClient(main.app) as client:
+            main.app.dependency_overrides[get_db] = override_broken_db
+            response = client.get("/healthz")
+            assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+            assert main._HEALTH_CACHE["ok_until"] == 0.0
+
+            main.app.dependency_overrides[get_db] = working_db
+            assert client.get("/healthz").status_code == status.HTTP_200_OK
+            assert main._HEALTH_CACHE["ok_until"] > time.monotonic()
+
+            # Within the window the database is not queried again
+            main.app.dependency_overrides[get_db] = override_broken_db
+            assert client.get("/healthz").status_code == status.HTTP_200_OK
+
+            main._HEALTH_CACHE["ok_until"] = 0.0
+            response = client.get("/healthz")
+            assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
 
 class TestUserRegistration:
     """Test user registration endpoint."""
@@ -192,6 +275,82 @@ class TestProtectedEndpoints:
         response = client.get("/me", headers=headers)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
+    def test_get_current_user_cached_token(self, client, test_user_data):
+        """Test repeat requests with one token are served from the cache."""
+        from main import _TOKEN_CACHE
+
+        client.post("/register", json=test_user_data)
+        login_response = client.post("/login", json={
+            "email": test_user_data["email"],
+            "password": test_user_data["password"]
+        })
+        token = login_response.json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = client.get("/me", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert token in _TOKEN_CACHE
+
+        response = client.get("/me", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["email"] == test_user_data["email"]
+
+    def test_cached_token_not_served_after_expiry(
+        self, client, test_user_data
+    ):
+        """Test a cached token is rejected once its exp has passed."""
+        client.post("/register", json=test_user_data)
+        token = main.create_access_token(
+            {"sub": test_user_data["email"]}, timedelta(seconds=1)
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = client.get("/me", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert token in main._TOKEN_CACHE
+
+        exp = jwt.get_unverified_claims(token)["exp"]
+        time.sleep(max(0.0, exp - time.time()) + 1.1)
+
+        assert token not in main._TOKEN_CACHE
+        response = client.get("/me", headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()["detail"] == "Token has expired"
+
+    def test_shared_token_cache_unavailable(
+        self, client, test_user_data, monkeypatch
+    ):
+        """Test a failing Redis tier falls back to JWT and database checks."""
+        headers = register_and_login(client, test_user_data)
+        monkeypatch.setattr(main, "_redis", FakeRedis(fail=True))
+
+        response = client.get("/me", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["email"] == test_user_data["email"]
+
+    @pytest.mark.parametrize("raw", [b"not-json", b'{"id": 1}'])
+    def test_shared_token_cache_bad_entry(
+        self, client, test_user_data, monkeypatch, raw
+    ):
+        """Test an unreadable Redis entry is dropped and the token checked."""
+        headers = register_and_login(client, test_user_data)
+        fake = FakeRedis(raw=raw)
+        monkeypatch.setattr(main, "_redis", fake)
+
+        response = client.get("/me", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["email"] == test_user_data["email"]
+        assert len(fake.deleted) == 1
+
+        # The entry written back after verification round-trips through the
+        # reader
+        fake.raw = next(iter(fake.stored.values()))
+        main._TOKEN_CACHE.clear()
+        response = client.get("/me", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["is_active"] is True
+        assert len(fake.deleted) == 1
+
 
 class TestMetrics:
     """Test metrics endpoint."""
@@ -206,3 +365,23 @@ class TestMetrics:
         content = response.text
         assert "http_requests_total" in content
         assert "http_request_duration_seconds" in content
+
+    def test_metrics_label_plain_starlette_routes(self, client, monkeypatch):
+        """Test docs routes are counted under their own path."""
+        monkeypatch.setitem(main._METRICS_CACHE, "expires", 0.0)
+
+        assert client.get("/openapi.json").status_code == status.HTTP_200_OK
+        content = client.get("/metrics").text
+        sample = 'endpoint="/openapi.json",method="GET",status="200"} 1.0'
+        assert sample in content
+
+    def test_metrics_snapshot_reused_within_window(self, client, monkeypatch):
+        """Test scrapes inside METRICS_CACHE_SECONDS share one snapshot."""
+        monkeypatch.setitem(main._METRICS_CACHE, "expires", 0.0)
+
+        first = client.get("/metrics").text
+        client.get("/healthz")
+        assert client.get("/metrics").text == first
+
+        main._METRICS_CACHE["expires"] = 0.0
+        assert client.get("/metrics").text != first